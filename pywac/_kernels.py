@@ -0,0 +1,60 @@
+"""
+Numeric kernels for PyWAC.
+
+Uses numba when it is installed; otherwise falls back to NumPy reductions
+that avoid allocating temporaries.
+"""
+
+import math
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _rms_peak_loop(flat):
+        ss = 0.0
+        pk = 0.0
+        for i in range(flat.size):
+            x = float(flat[i])
+            ss += x * x
+            ax = abs(x)
+            if ax > pk:
+                pk = ax
+        return math.sqrt(ss / flat.size), pk
+else:
+    _rms_peak_loop = None
+
+
+def rms_peak(buffer: np.ndarray) -> Tuple[float, float]:
+    """
+    Calculate RMS and peak absolute value of an audio buffer.
+
+    Args:
+        buffer: Audio samples (any shape, float or integer dtype)
+
+    Returns:
+        Tuple of (rms, peak); (0.0, 0.0) for an empty buffer
+    """
+    flat = np.ravel(buffer)
+    if flat.size == 0:
+        return 0.0, 0.0
+
+    if _rms_peak_loop is not None:
+        rms, peak = _rms_peak_loop(flat)
+        return float(rms), float(peak)
+
+    # Integer samples would overflow in dot(), so reduce in float64
+    if not np.issubdtype(flat.dtype, np.floating):
+        flat = flat.astype(np.float64)
+
+    # dot() streams the buffer once without a squared temporary;
+    # min/max avoid materializing an abs() copy
+    rms = math.sqrt(float(np.dot(flat, flat)) / flat.size)
+    peak = max(float(flat.max()), -float(flat.min()))
+    return rms, peak
@@ -3,10 +3,12 @@ Simple function API for PyWAC.
 Provides easy-to-use functions for common audio tasks.
 """
 
+import os
 import threading
 import warnings
 import numpy as np
-from typing import List, Optional, Dict, Any, Callable
+from concurrent.futures import Future
+from typing import BinaryIO, List, Optional, Dict, Any, Callable, Union
 from .sessions import SessionManager
 from .recorder import AudioRecorder
 from .audio_data import AudioData
@@ -22,6 +24,11 @@ def _import_process_loopback():
         return None
 
 
+# Deprecation messages for the old function names (built once, not per call)
+_FIND_APP_DEPRECATED = "find_app() is deprecated, use find_audio_session() instead"
+_GET_ACTIVE_APPS_DEPRECATED = "get_active_apps() is deprecated, use get_active_sessions() instead"
+
+
 # Thread-safe global instances for convenience functions
 _lock = threading.Lock()
 _global_session_manager: Optional[SessionManager] = None
@@ -31,21 +38,27 @@ _global_audio_recorder: Optional[AudioRecorder] = None
 def _get_session_manager() -> SessionManager:
     """Get or create thread-safe global SessionManager instance."""
     global _global_session_manager
-    if _global_session_manager is None:
-        with _lock:
-            if _global_session_manager is None:  # Double-check locking
-                _global_session_manager = SessionManager()
-    return _global_session_manager
+    # Fast path: a single unlocked read once the instance exists
+    manager = _global_session_manager
+    if manager is not None:
+        return manager
+    with _lock:
+        if _global_session_manager is None:  # Double-check locking
+            _global_session_manager = SessionManager()
+        return _global_session_manager
 
 
 def _get_audio_recorder() -> AudioRecorder:
     """Get or create thread-safe global AudioRecorder instance."""
     global _global_audio_recorder
-    if _global_audio_recorder is None:
-        with _lock:
-            if _global_audio_recorder is None:  # Double-check locking
-                _global_audio_recorder = AudioRecorder()
-    return _global_audio_recorder
+    # Fast path: a single unlocked read once the instance exists
+    recorder = _global_audio_recorder
+    if recorder is not None:
+        return recorder
+    with _lock:
+        if _global_audio_recorder is None:  # Double-check locking
+            _global_audio_recorder = AudioRecorder()
+        return _global_audio_recorder
 
 
 def refresh_sessions() -> None:
@@ -217,7 +230,7 @@ def _record_with_loopback(pid: int, duration: float) -> Optional[AudioData]:
         if audio_chunks:
             audio_data = np.concatenate(audio_chunks, axis=0)
             return AudioData.from_interleaved(
-                data=audio_data.flatten(),
+                data=audio_data.ravel(),
                 sample_rate=48000,
                 channels=2
             )
@@ -246,12 +259,12 @@ def record_audio(duration: float) -> AudioData:
     return unified_record(duration, target=None, fallback_enabled=True)
 
 
-def record_to_file(filename: str, duration: float) -> bool:
+def record_to_file(filename: Union[str, os.PathLike, BinaryIO], duration: float) -> bool:
     """
     Record system-wide audio directly to a WAV file.
     
     Args:
-        filename: Output WAV filename
+        filename: Output WAV filename, or a writable binary file object
         duration: Recording duration in seconds
         
     Returns:
@@ -388,11 +401,7 @@ def find_app(app_name: str) -> Optional[Dict[str, Any]]:
 
     Find an application by name and return its audio session info.
     """
-    warnings.warn(
-        "find_app() is deprecated, use find_audio_session() instead",
-        DeprecationWarning,
-        stacklevel=2
-    )
+    warnings.warn(_FIND_APP_DEPRECATED, DeprecationWarning, stacklevel=2)
     return find_audio_session(app_name)
 
 
@@ -417,11 +426,7 @@ def get_active_apps() -> List[str]:
 
     Get list of applications currently playing audio.
     """
-    warnings.warn(
-        "get_active_apps() is deprecated, use get_active_sessions() instead",
-        DeprecationWarning,
-        stacklevel=2
-    )
+    warnings.warn(_GET_ACTIVE_APPS_DEPRECATED, DeprecationWarning, stacklevel=2)
     return get_active_sessions()
 
 
@@ -452,14 +457,20 @@ def adjust_volume(app_name: str, delta: float) -> Optional[float]:
     return None
 
 
-def record_with_callback(duration: float, callback: Callable[[AudioData], None]) -> None:
+def record_with_callback(duration: float, callback: Callable[[AudioData], None]) -> Future:
     """
     Record audio asynchronously with a callback.
     
+    The recording runs on a daemon thread. Errors are reported through
+    threading.excepthook and also stored in the returned Future.
+    
     Args:
         duration: Recording duration in seconds
         callback: Function called when recording completes (receives AudioData)
         
+    Returns:
+        Future resolving to the recorded AudioData
+        
     Example:
         >>> def on_complete(audio):
         ...     print(f"Recording complete: {audio.duration:.1f} seconds")
@@ -467,4 +478,4 @@ def record_with_callback(duration: float, callback: Callable[[AudioData], None])
         >>> pywac.record_with_callback(5, on_complete)
     """
     # Use unified recording with callback
-    unified_record(duration, target=None, on_complete=callback)
\ No newline at end of file
+    return unified_record(duration, target=None, on_complete=callback)
\ No newline at end of file
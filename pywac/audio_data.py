@@ -5,11 +5,161 @@ This module provides a standardized way to handle audio data across
 all components of the library, ensuring consistency and type safety.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Union, Optional, Tuple
+from typing import BinaryIO, Union, Optional, Tuple
 import numpy as np
-import wave
+import copy
+import functools
+import os
+import threading
 import struct
+from ._kernels import rms_peak
+
+
+# Recently loaded WAV files, keyed by path and validated against a
+# (mtime_ns, size) fingerprint so repeated loads skip parsing and I/O.
+# Entries hold read-only sample arrays that are shared with callers.
+# Bounded by entry count, per-file size and total size of cached samples.
+_LOAD_CACHE_SIZE = 16
+_LOAD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_LOAD_CACHE_MAX_TOTAL_BYTES = 64 * 1024 * 1024
+_load_cache_lock = threading.Lock()
+_load_cache: 'OrderedDict[str, Tuple[Tuple[int, int], AudioData]]' = OrderedDict()
+_load_cache_bytes = 0
+
+
+def _load_cache_key(filename: str) -> str:
+    """Normalize a path for use as a load cache key."""
+    return os.path.normcase(os.path.abspath(os.fspath(filename)))
+
+
+def _load_cache_get(key: str, fingerprint: Tuple[int, int]) -> Optional['AudioData']:
+    """Return the cached AudioData for key if its fingerprint still matches."""
+    with _load_cache_lock:
+        entry = _load_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] != fingerprint:
+            # File changed on disk since it was cached
+            _load_cache_pop(key)
+            return None
+        _load_cache.move_to_end(key)
+        return entry[1]
+
+
+def _load_cache_pop(key: str) -> None:
+    """Remove key from the cache and its byte count. Caller holds the lock."""
+    global _load_cache_bytes
+    entry = _load_cache.pop(key, None)
+    if entry is not None:
+        _load_cache_bytes -= entry[1].samples.nbytes
+
+
+def _load_cache_put(key: str, fingerprint: Tuple[int, int], audio: 'AudioData') -> None:
+    """Insert a loaded file into the cache, evicting the least recently used."""
+    global _load_cache_bytes
+    if audio.samples.nbytes > _LOAD_CACHE_MAX_BYTES:
+        return
+    with _load_cache_lock:
+        _load_cache_pop(key)
+        _load_cache[key] = (fingerprint, audio)
+        _load_cache_bytes += audio.samples.nbytes
+        while (len(_load_cache) > _LOAD_CACHE_SIZE
+               or _load_cache_bytes > _LOAD_CACHE_MAX_TOTAL_BYTES):
+            _load_cache_pop(next(iter(_load_cache)))
+
+
+def _load_cache_discard(key: str) -> None:
+    """Drop any cached entry for key (e.g. before the file is rewritten)."""
+    with _load_cache_lock:
+        _load_cache_pop(key)
+
+
+def _load_cache_clear() -> None:
+    """Drop every cached entry."""
+    global _load_cache_bytes
+    with _load_cache_lock:
+        _load_cache.clear()
+        _load_cache_bytes = 0
+
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_SIZE = struct.Struct('<I')
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+
+
+@functools.lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    """Canonical PCM header for a format, with both size fields left at zero."""
+    block_align = channels * bits_per_sample // 8
+    return _WAV_HEADER.pack(
+        b'RIFF', 0, b'WAVE',
+        b'fmt ', 16, _WAVE_FORMAT_PCM, channels, sample_rate,
+        sample_rate * block_align, block_align, bits_per_sample,
+        b'data', 0,
+    )
+
+
+def _pack_wav_header(data_size: int, sample_rate: int, channels: int,
+                     bits_per_sample: int) -> bytearray:
+    """Build the canonical 44-byte PCM WAV header in a single buffer."""
+    # Formats repeat (48 kHz stereo int16 almost always), so only the two
+    # size fields are patched into a cached per-format template
+    header = bytearray(_wav_header_template(sample_rate, channels, bits_per_sample))
+    _WAV_SIZE.pack_into(header, _WAV_RIFF_SIZE_OFFSET, 36 + data_size)
+    _WAV_SIZE.pack_into(header, _WAV_DATA_SIZE_OFFSET, data_size)
+    return header
+
+
+def _read_wav_header(f) -> Tuple[int, int, int, int, int]:
+    """
+    Parse the RIFF chunks of a PCM WAV file up to the start of the data.
+    
+    Args:
+        f: Binary file object positioned at the start of the file
+        
+    Returns:
+        Tuple of (channels, sample_rate, sample_width, data_offset, data_size).
+        On return the file is positioned at data_offset.
+    """
+    riff = f.read(12)
+    if len(riff) < 12 or riff[0:4] != b'RIFF' or riff[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+    
+    fmt = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        
+        if chunk_id == b'fmt ':
+            fmt = f.read(chunk_size)
+            if len(fmt) < 16:
+                raise ValueError("WAV fmt chunk is truncated")
+            if chunk_size % 2:
+                f.seek(1, 1)
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError("WAV data chunk precedes fmt chunk")
+            break
+        else:
+            # Skip unrelated chunks (LIST, fact, ...); chunks are word-aligned
+            f.seek(chunk_size + (chunk_size % 2), 1)
+    
+    format_tag, channels, sample_rate, _, _, bits_per_sample = struct.unpack(
+        '<HHIIHH', fmt[:16]
+    )
+    if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE):
+        raise ValueError(f"Unsupported WAV format tag: {format_tag:#06x}")
+    
+    return channels, sample_rate, bits_per_sample // 8, f.tell(), chunk_size
 
 
 @dataclass
@@ -26,7 +176,13 @@ class AudioData:
                  for multi-channel or (num_frames,) for mono
         sample_rate: Sample rate in Hz (e.g., 48000)
         channels: Number of audio channels (1 for mono, 2 for stereo)
+    
+    Instances are treated as immutable once constructed: conversions return
+    new AudioData objects, and frame count / duration are computed once.
     """
+    __slots__ = ('samples', 'sample_rate', 'channels', '_num_frames', '_duration',
+                 '__weakref__')
+    
     samples: np.ndarray
     sample_rate: int
     channels: int
@@ -59,18 +215,20 @@ class AudioData:
                 )
         else:
             raise ValueError(f"Invalid samples shape: {self.samples.shape}")
+        
+        # Cache derived values so property reads are plain attribute loads
+        self._num_frames = self.samples.shape[0]
+        self._duration = self._num_frames / self.sample_rate if self.sample_rate else 0.0
     
     @property
     def num_frames(self) -> int:
         """Get the number of audio frames."""
-        if self.samples.ndim == 1:
-            return len(self.samples)
-        return self.samples.shape[0]
+        return self._num_frames
     
     @property
     def duration(self) -> float:
         """Get the duration in seconds."""
-        return self.num_frames / self.sample_rate
+        return self._duration
     
     @property
     def dtype(self) -> np.dtype:
@@ -87,10 +245,16 @@ class AudioData:
         if self.dtype == np.float32:
             return self
         
+        # Scale in a single ufunc pass that writes float32 directly,
+        # instead of astype() followed by a separate divide
         if self.dtype == np.int16:
-            samples_float = self.samples.astype(np.float32) / 32768.0
+            samples_float = np.multiply(
+                self.samples, np.float32(1.0 / 32768.0), dtype=np.float32
+            )
         elif self.dtype == np.int32:
-            samples_float = self.samples.astype(np.float32) / 2147483648.0
+            samples_float = np.multiply(
+                self.samples, np.float32(1.0 / 2147483648.0), dtype=np.float32
+            )
         else:
             # Assume it's already some kind of float
             samples_float = self.samples.astype(np.float32)
@@ -108,9 +272,11 @@ class AudioData:
             return self
         
         if self.dtype == np.float32 or self.dtype == np.float64:
-            # Clip to prevent overflow
-            samples_clipped = np.clip(self.samples, -1.0, 1.0)
-            samples_int16 = (samples_clipped * 32767).astype(np.int16)
+            # Scale into one float32 temporary, then clip and round it in place
+            scaled = np.multiply(self.samples, np.float32(32767.0), dtype=np.float32)
+            np.clip(scaled, -32767.0, 32767.0, out=scaled)
+            np.rint(scaled, out=scaled)
+            samples_int16 = scaled.astype(np.int16)
         else:
             samples_int16 = self.samples.astype(np.int16)
         
@@ -142,7 +308,22 @@ class AudioData:
             return self
         
         if self.samples.ndim == 2:
-            mono_samples = np.mean(self.samples, axis=1)
+            # Accumulate whole channel planes: one vectorized add per channel
+            # is far faster than reducing along the short (channels) axis
+            if np.issubdtype(self.dtype, np.integer):
+                # Integer PCM: sum into a wider accumulator to avoid overflow
+                acc_dtype = np.int32 if self.dtype == np.int16 else np.int64
+                acc = self.samples[:, 0].astype(acc_dtype)
+                for ch in range(1, self.channels):
+                    acc += self.samples[:, ch]
+                acc //= self.channels
+                mono_samples = acc.astype(self.dtype)
+            else:
+                # Keep the input precision
+                mono_samples = np.add(self.samples[:, 0], self.samples[:, 1])
+                for ch in range(2, self.channels):
+                    mono_samples += self.samples[:, ch]
+                mono_samples /= self.channels
         else:
             # Interleaved stereo in 1D
             left = self.samples[0::2]
@@ -151,83 +332,171 @@ class AudioData:
         
         return AudioData(mono_samples, self.sample_rate, 1)
     
-    def save(self, filename: str) -> None:
+    def save(self, filename: Union[str, os.PathLike, BinaryIO]) -> None:
         """
         Save audio data to a WAV file.
         
         Args:
-            filename: Output filename
+            filename: Output filename, or a writable binary file object
+                (e.g. ``io.BytesIO``), which is left open
         """
         # Convert to int16 for WAV format
         audio_int16 = self.to_int16()
         
-        with wave.open(filename, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(self.sample_rate)
-            
-            # Convert to bytes
-            if audio_int16.channels == 1:
-                data = audio_int16.samples.tobytes()
-            else:
-                # Ensure interleaved format for WAV
-                data = audio_int16.to_interleaved().tobytes()
-            
-            wf.writeframes(data)
+        # (frames, channels) C-order is already interleaved; make sure the
+        # buffer is contiguous little-endian so it can be written as-is
+        data = np.ascontiguousarray(audio_int16.samples, dtype='<i2')
+        
+        header = _pack_wav_header(data.nbytes, self.sample_rate, self.channels, 16)
+        
+        if hasattr(filename, 'write'):
+            filename.write(header)
+            filename.write(data)
+            return
+        
+        # Never serve the previous contents of this path from the load cache
+        _load_cache_discard(_load_cache_key(filename))
+        
+        with open(filename, 'wb') as f:
+            f.write(header)
+            f.write(data)
     
     @classmethod
-    def load(cls, filename: str) -> 'AudioData':
+    def load(cls, filename: Union[str, os.PathLike, BinaryIO],
+             use_mmap: bool = False) -> 'AudioData':
         """
         Load audio data from a WAV file.
         
+        Samples are read straight into the returned (read-only) array,
+        without an intermediate bytes object. Recently loaded files are
+        cached by path and validated against their modification time and
+        size, so loading an unchanged file again is a cache hit. The cache
+        holds at most 16 files and 64 MB of samples; see clear_load_cache(). With
+        ``use_mmap=True`` the samples are a read-only memory map of the
+        file's data chunk instead, so pages are only read when accessed.
+        The mapping keeps the file open (and, on Windows, undeletable)
+        until the AudioData is released.
+        
+        A readable, seekable binary file object (e.g. ``io.BytesIO``) is
+        read from its current position and never cached or memory-mapped.
+        
         Args:
-            filename: Input filename
+            filename: Input filename, or a binary file object
+            use_mmap: If True, memory-map the sample data instead of reading it
             
         Returns:
             AudioData instance
         """
-        with wave.open(filename, 'rb') as wf:
-            channels = wf.getnchannels()
-            sample_rate = wf.getframerate()
-            sample_width = wf.getsampwidth()
-            num_frames = wf.getnframes()
-            
-            # Read audio data
-            audio_bytes = wf.readframes(num_frames)
-            
-            # Convert bytes to numpy array based on sample width
-            if sample_width == 2:  # 16-bit
-                samples = np.frombuffer(audio_bytes, dtype=np.int16)
-            elif sample_width == 4:  # 32-bit
-                samples = np.frombuffer(audio_bytes, dtype=np.int32)
-            else:
-                raise ValueError(f"Unsupported sample width: {sample_width}")
-            
-            # Reshape for multi-channel
-            if channels > 1:
-                samples = samples.reshape(-1, channels)
-            
-            return cls(samples, sample_rate, channels)
+        if hasattr(filename, 'read'):
+            if use_mmap:
+                raise ValueError("use_mmap requires a filename, not a file object")
+            return cls._read_wav_file(filename)
+        
+        if use_mmap:
+            return cls._read_wav(filename, use_mmap=True)
+        
+        key = _load_cache_key(filename)
+        st = os.stat(filename)
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        
+        cached = _load_cache_get(key, fingerprint)
+        if cached is not None and type(cached) is cls:
+            return copy.copy(cached)
+        
+        audio = cls._read_wav(filename)
+        _load_cache_put(key, fingerprint, audio)
+        return copy.copy(audio)
+    
+    @staticmethod
+    def clear_load_cache() -> None:
+        """
+        Release all files cached by load().
+        
+        Call this to free memory after loading many files, or to force
+        the next load() of every file to read it from disk.
+        """
+        _load_cache_clear()
     
     @classmethod
-    def from_interleaved(cls, data: Union[list, np.ndarray], 
+    def _read_wav(cls, filename: str, use_mmap: bool = False) -> 'AudioData':
+        """Parse a WAV file into a new AudioData (see load())."""
+        with open(filename, 'rb') as f:
+            return cls._read_wav_file(f, use_mmap)
+    
+    @classmethod
+    def _read_wav_file(cls, f: BinaryIO, use_mmap: bool = False) -> 'AudioData':
+        """Parse WAV data from an open binary file object (see load())."""
+        channels, sample_rate, sample_width, data_offset, data_size = \
+            _read_wav_header(f)
+        
+        # Convert sample width to numpy dtype
+        if sample_width == 2:  # 16-bit
+            dtype = np.dtype(np.int16)
+        elif sample_width == 4:  # 32-bit
+            dtype = np.dtype(np.int32)
+        else:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+        
+        # Clamp to the bytes actually present (streamed files may
+        # carry a placeholder data size) and to whole frames
+        file_size = f.seek(0, os.SEEK_END)
+        f.seek(data_offset)
+        data_size = min(data_size, file_size - data_offset)
+        frame_bytes = sample_width * channels
+        num_samples = (data_size // frame_bytes) * channels
+        
+        if use_mmap and num_samples > 0:
+            samples = np.memmap(f, dtype=dtype, mode='r',
+                                offset=data_offset, shape=(num_samples,))
+        elif hasattr(f, 'readinto'):
+            samples = np.empty(num_samples, dtype=dtype)
+            f.readinto(samples)
+            # Loaded samples may be shared through the load cache
+            samples.flags.writeable = False
+        else:
+            # frombuffer over the bytes object is already read-only
+            samples = np.frombuffer(f.read(num_samples * dtype.itemsize), dtype=dtype)
+        
+        # Reshape for multi-channel
+        if channels > 1:
+            samples = samples.reshape(-1, channels)
+        
+        return cls(samples, sample_rate, channels)
+    
+    @classmethod
+    def from_interleaved(cls, data: Union[list, np.ndarray, bytes, memoryview], 
                         sample_rate: int = 48000, 
                         channels: int = 2) -> 'AudioData':
         """
         Create AudioData from interleaved audio data.
         
         This is particularly useful for handling data from the C++ layer
-        which returns interleaved float32 data.
+        which returns interleaved float32 data. Arrays and raw buffers are
+        wrapped without copying; the (frames, channels) layout is a view
+        onto the interleaved data.
         
         Args:
-            data: Interleaved audio samples [L0, R0, L1, R1, ...]
+            data: Interleaved audio samples [L0, R0, L1, R1, ...], or a raw
+                  buffer of interleaved float32 samples
             sample_rate: Sample rate in Hz
             channels: Number of channels
             
         Returns:
             AudioData instance
         """
-        return cls(np.array(data), sample_rate, channels)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(data, dtype=np.float32)
+        else:
+            samples = np.asarray(data)
+        
+        if channels > 1 and samples.ndim == 1:
+            # Drop any incomplete trailing frame, then view as (frames, channels)
+            remainder = len(samples) % channels
+            if remainder:
+                samples = samples[:-remainder]
+            samples = samples.reshape(-1, channels)
+        
+        return cls(samples, sample_rate, channels)
     
     def get_statistics(self) -> dict:
         """
@@ -252,11 +521,8 @@ class AudioData:
         # Convert to float for calculations
         audio_float = self.to_float32()
         
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio_float.samples ** 2))
-        
-        # Calculate peak
-        peak = np.max(np.abs(audio_float.samples))
+        # Calculate RMS and peak in one pass
+        rms, peak = rms_peak(audio_float.samples)
         
         # Calculate dB levels
         rms_db = 20 * np.log10(rms + 1e-10)
@@ -286,8 +552,13 @@ class AudioData:
         """Check equality with another AudioData instance."""
         if not isinstance(other, AudioData):
             return False
-        return (
-            np.array_equal(self.samples, other.samples) and
-            self.sample_rate == other.sample_rate and
-            self.channels == other.channels
-        )
\ No newline at end of file
+        if self is other:
+            return True
+        # Compare cheap scalars and shapes before scanning the sample data
+        if (
+            self.sample_rate != other.sample_rate or
+            self.channels != other.channels or
+            self.samples.shape != other.samples.shape
+        ):
+            return False
+        return bool(np.array_equal(self.samples, other.samples))
\ No newline at end of file
@@ -2,14 +2,34 @@
 Audio recording module for PyWAC with unified AudioData format.
 """
 
+import os
 import time
 import threading
 import numpy as np
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from datetime import datetime
 from pywac import core as _native  # Native extension: session enumeration and system loopback
 from .audio_data import AudioData
 
+# Capture buffer sizing: manual recordings start with this many seconds and
+# grow by doubling; timed recordings get the duration plus some slack
+_DEFAULT_BUFFER_SECONDS = 10.0
+_BUFFER_SLACK_SECONDS = 0.5
+# Free space kept ahead of each native read (the loopback drains whole packets)
+_MIN_FREE_SECONDS = 0.1
+# stop() returns a view of the buffer only if at least this fraction is used
+_VIEW_MIN_FILL = 0.75
+
+
+def _supports_read_into(loopback) -> bool:
+    """Return True if the loopback has the get_buffer(out) overload (older core builds lack it)."""
+    try:
+        # Nothing is drained before start(), so this only probes the signature
+        loopback.get_buffer(np.empty(0, dtype=np.float32))
+        return True
+    except TypeError:
+        return False
+
 
 class AudioRecorder:
     """High-level interface for audio recording."""
@@ -25,7 +45,9 @@ class AudioRecorder:
         self.sample_rate = sample_rate
         self.channels = channels
         self._loopback = None
-        self._audio_buffer = []
+        self._read_into = True
+        self._audio_buffer = np.empty(0, dtype=np.float32)
+        self._write_pos = 0
         self._is_recording = False
         self._recording_thread = None
         self._start_time = None
@@ -45,11 +67,18 @@ class AudioRecorder:
             raise RuntimeError("Recording is already in progress")
         
         try:
-            self._loopback = _native.SimpleLoopback()
+            # The loopback client is reused across recordings; restarting it
+            # skips device activation unless the default output device changed
+            if self._loopback is None:
+                self._loopback = _native.SimpleLoopback()
+                self._read_into = _supports_read_into(self._loopback)
             if not self._loopback.start():
                 raise RuntimeError("Failed to start loopback capture")
             
-            self._audio_buffer = []
+            seconds = (duration if duration else _DEFAULT_BUFFER_SECONDS) + _BUFFER_SLACK_SECONDS
+            self._audio_buffer = np.empty(
+                int(seconds * self.sample_rate) * self.channels, dtype=np.float32)
+            self._write_pos = 0
             self._is_recording = True
             self._start_time = time.time()
             self._duration = duration
@@ -62,6 +91,7 @@ class AudioRecorder:
             return True
             
         except Exception as e:
+            self._loopback = None
             self._cleanup()
             raise RuntimeError(f"Failed to start recording: {e}")
     
@@ -73,7 +103,7 @@ class AudioRecorder:
             AudioData object containing the recorded audio
         """
         # Check if there's anything to stop
-        if not self._recording_thread and not self._loopback:
+        if self._recording_thread is None:
             # Return empty AudioData
             return AudioData(
                 samples=np.array([], dtype=np.float32).reshape(0, self.channels),
@@ -95,8 +125,11 @@ class AudioRecorder:
             except:
                 pass  # Ignore errors if already stopped
         
-        # Get the recorded audio
-        audio_buffer = self._audio_buffer.copy() if self._audio_buffer else []
+        # Hand the recorded part of the buffer over without copying when it
+        # is mostly full; otherwise copy so the unused tail can be freed
+        audio_buffer = self._audio_buffer[:self._write_pos]
+        if self._write_pos < len(self._audio_buffer) * _VIEW_MIN_FILL:
+            audio_buffer = audio_buffer.copy()
         
         # Clean up
         self._cleanup()
@@ -115,12 +148,18 @@ class AudioRecorder:
                     self._loopback.stop()
                 break
             
-            # Get audio buffer
+            # Read captured audio straight into the preallocated buffer
             try:
-                if self._loopback:
-                    buffer = self._loopback.get_buffer()
-                    if len(buffer) > 0:
-                        self._audio_buffer.extend(buffer)
+                if self._loopback and self._read_into:
+                    self._ensure_capacity(int(_MIN_FREE_SECONDS * self.sample_rate) * self.channels)
+                    self._write_pos += self._loopback.get_buffer(
+                        self._audio_buffer[self._write_pos:])
+                elif self._loopback:
+                    # Older core build: get_buffer() returns a new array to copy in
+                    chunk = np.asarray(self._loopback.get_buffer(), dtype=np.float32)
+                    self._ensure_capacity(len(chunk))
+                    self._audio_buffer[self._write_pos:self._write_pos + len(chunk)] = chunk
+                    self._write_pos += len(chunk)
             except Exception:
                 # Ignore errors during recording
                 pass
@@ -128,10 +167,25 @@ class AudioRecorder:
             # Small sleep to prevent CPU overuse
             time.sleep(0.01)
     
+    def _ensure_capacity(self, free: int):
+        """Grow the capture buffer so at least ``free`` samples fit after the write position."""
+        needed = self._write_pos + free
+        if needed <= len(self._audio_buffer):
+            return
+        grown = np.empty(max(needed, 2 * len(self._audio_buffer)), dtype=np.float32)
+        grown[:self._write_pos] = self._audio_buffer[:self._write_pos]
+        self._audio_buffer = grown
+    
+    def _reset(self):
+        """Discard recorded audio, keeping the loopback client for reuse."""
+        if self._is_recording:
+            raise RuntimeError("Cannot reset while recording")
+        self._cleanup()
+    
     def _cleanup(self):
-        """Clean up resources."""
-        self._loopback = None
-        self._audio_buffer = []
+        """Clean up per-recording state (the loopback client is kept)."""
+        self._audio_buffer = np.empty(0, dtype=np.float32)
+        self._write_pos = 0
         self._is_recording = False
         self._recording_thread = None
         self._start_time = None
@@ -142,12 +196,12 @@ class AudioRecorder:
         Create AudioData from raw buffer.
         
         Args:
-            buffer: Raw audio buffer from loopback
+            buffer: Interleaved float32 samples captured from loopback
             
         Returns:
             AudioData object
         """
-        if not buffer:
+        if len(buffer) == 0:
             # Return empty AudioData
             return AudioData(
                 samples=np.array([], dtype=np.float32).reshape(0, self.channels),
@@ -177,12 +231,12 @@ class AudioRecorder:
         time.sleep(duration)
         return self.stop()
     
-    def record_to_file(self, filename: str, duration: float) -> bool:
+    def record_to_file(self, filename: Union[str, os.PathLike, BinaryIO], duration: float) -> bool:
         """
         Record audio directly to a WAV file.
         
         Args:
-            filename: Output WAV filename
+            filename: Output WAV filename, or a writable binary file object
             duration: Recording duration in seconds
             
         Returns:
@@ -210,7 +264,7 @@ class AudioRecorder:
     @property
     def sample_count(self) -> int:
         """Get current number of recorded samples."""
-        return len(self._audio_buffer)
+        return self._write_pos
     
     def get_audio(self) -> AudioData:
         """
@@ -219,7 +273,9 @@ class AudioRecorder:
         Returns:
             AudioData object with current buffer content
         """
-        return self._create_audio_data(self._audio_buffer.copy())
+        # Read the position first: the buffer only ever grows, so the slice stays valid
+        write_pos = self._write_pos
+        return self._create_audio_data(self._audio_buffer[:write_pos].copy())
     
     def save(self, filename: Optional[str] = None) -> str:
         """
@@ -2,7 +2,8 @@
 Audio session management module for PyWAC.
 """
 
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from pywac import core as _native  # Native extension: session enumeration and system loopback
 
@@ -43,31 +44,52 @@ class AudioSession:
 class SessionManager:
     """High-level interface for managing audio sessions."""
     
-    def __init__(self):
-        """Initialize the session manager."""
+    def __init__(self, cache_ttl: float = 0.5):
+        """
+        Initialize the session manager.
+        
+        Args:
+            cache_ttl: Seconds an enumerated session list is reused before
+                       WASAPI is queried again (0 disables caching)
+        """
         try:
             self._enumerator = _native.SessionEnumerator()
         except Exception as e:
             raise RuntimeError(f"Failed to initialize SessionManager: {e}")
+        
+        self._cache_ttl = cache_ttl
+        self._cache: Optional[List[AudioSession]] = None
+        self._cache_time = 0.0
+        self._cache_change_count = None
+        # (sessions, exact lowercase name -> session, lowercase names) for find_session
+        self._name_index: Optional[
+            Tuple[List[AudioSession], Dict[str, AudioSession], List[str]]
+        ] = None
     
-    def list_sessions(self, active_only: bool = False) -> List[AudioSession]:
-        """
-        List all audio sessions.
+    def _get_change_count(self) -> Optional[int]:
+        """Get the native session/device change counter, if supported."""
+        if hasattr(self._enumerator, 'get_change_count'):
+            return self._enumerator.get_change_count()
+        return None
+    
+    def _get_all_sessions(self) -> List[AudioSession]:
+        """Get all sessions, re-enumerating only when the cache is stale."""
+        cache = self._cache
+        if (
+            cache is not None and
+            time.monotonic() - self._cache_time < self._cache_ttl and
+            self._get_change_count() == self._cache_change_count
+        ):
+            return cache
         
-        Args:
-            active_only: If True, only return active sessions
-            
-        Returns:
-            List of AudioSession objects
-        """
+        change_count = self._get_change_count()
         try:
             raw_sessions = self._enumerator.enumerate_sessions()
         except Exception as e:
             raise RuntimeError(f"Failed to enumerate sessions: {e}")
         
-        sessions = []
-        for raw in raw_sessions:
-            session = AudioSession(
+        sessions = [
+            AudioSession(
                 process_id=raw.process_id,
                 process_name=raw.process_name,
                 display_name=raw.display_name if hasattr(raw, 'display_name') else '',
@@ -75,27 +97,74 @@ class SessionManager:
                 volume=raw.volume,
                 muted=raw.muted
             )
-            
-            if not active_only or session.is_active:
-                sessions.append(session)
+            for raw in raw_sessions
+        ]
         
+        self._cache = sessions
+        self._cache_time = time.monotonic()
+        self._cache_change_count = change_count
         return sessions
     
+    def _get_name_index(
+        self
+    ) -> Tuple[List[AudioSession], Dict[str, AudioSession], List[str]]:
+        """Get the name lookup tables, rebuilt once per enumeration."""
+        sessions = self._get_all_sessions()
+        index = self._name_index
+        if index is None or index[0] is not sessions:
+            names = [s.process_name.lower() for s in sessions]
+            by_name: Dict[str, AudioSession] = {}
+            for name, session in zip(names, sessions):
+                by_name.setdefault(name, session)
+            index = (sessions, by_name, names)
+            self._name_index = index
+        return index
+    
+    def invalidate_cache(self) -> None:
+        """Discard the cached session list so the next query re-enumerates."""
+        self._cache = None
+    
+    def list_sessions(self, active_only: bool = False) -> List[AudioSession]:
+        """
+        List all audio sessions.
+        
+        Results are cached for ``cache_ttl`` seconds; the cache is also
+        dropped when Windows reports a new session or a device change, and
+        after volume/mute changes made through this manager.
+        
+        Args:
+            active_only: If True, only return active sessions
+            
+        Returns:
+            List of AudioSession objects
+        """
+        sessions = self._get_all_sessions()
+        if active_only:
+            return [s for s in sessions if s.is_active]
+        return list(sessions)
+    
     def find_session(self, app_name: str) -> Optional[AudioSession]:
         """
         Find a session by application name (case-insensitive partial match).
         
+        An exact (case-insensitive) name match is preferred; otherwise the
+        first session whose name contains ``app_name`` is returned.
+        
         Args:
             app_name: Name or partial name of the application
             
         Returns:
-            First matching AudioSession, or None if not found
+            Matching AudioSession, or None if not found
         """
         app_name_lower = app_name.lower()
-        sessions = self.list_sessions()
+        sessions, by_name, names = self._get_name_index()
+        
+        session = by_name.get(app_name_lower)
+        if session is not None:
+            return session
         
-        for session in sessions:
-            if app_name_lower in session.process_name.lower():
+        for name, session in zip(names, sessions):
+            if app_name_lower in name:
                 return session
         
         return None
@@ -122,6 +191,8 @@ class SessionManager:
             return self._enumerator.set_session_volume(session.process_id, volume)
         except Exception as e:
             raise RuntimeError(f"Failed to set volume: {e}")
+        finally:
+            self.invalidate_cache()
     
     def get_volume(self, app_name: str) -> Optional[float]:
         """
@@ -164,6 +235,8 @@ class SessionManager:
                     return False
         except Exception as e:
             raise RuntimeError(f"Failed to set mute state: {e}")
+        finally:
+            self.invalidate_cache()
     
     def is_muted(self, app_name: str) -> Optional[bool]:
         """
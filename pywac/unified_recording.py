@@ -8,10 +8,42 @@ import sys
 import time
 import threading
 import numpy as np
-from typing import Optional, Union, Callable
+from concurrent.futures import Future
+from typing import BinaryIO, Optional, Union, Callable
 from .audio_data import AudioData
 
 
+def _run_async(func: Callable[[], AudioData]) -> Future:
+    """
+    Run func on a daemon thread and return a Future for its result.
+    
+    Each call gets its own thread, so concurrent recordings start on time and
+    never keep the interpreter alive at exit. An exception is stored in the
+    Future and re-raised in the thread, so threading.excepthook still reports
+    it for callers that never read the Future.
+    
+    Args:
+        func: Callable producing the result
+        
+    Returns:
+        Future resolving to func's return value
+    """
+    future = Future()
+    
+    def _worker():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+    
+    threading.Thread(target=_worker, name='pywac-capture', daemon=True).start()
+    return future
+
+
 def _import_process_loopback():
     """Helper function to import pywac.capture module."""
     try:
@@ -108,7 +140,7 @@ def _capture_audio(pid: int, duration: float) -> Optional[AudioData]:
         if audio_chunks:
             audio_data = np.concatenate(audio_chunks, axis=0)
             return AudioData.from_interleaved(
-                data=audio_data.flatten(),
+                data=audio_data.ravel(),
                 sample_rate=48000,
                 channels=2
             )
@@ -138,22 +170,24 @@ def _capture_with_fallback(duration: float) -> AudioData:
 def record(
     duration: float,
     target: Optional[Union[str, int]] = None,
-    output_file: Optional[str] = None,
+    output_file: Optional[Union[str, os.PathLike, BinaryIO]] = None,
     on_complete: Optional[Callable[[AudioData], None]] = None,
     fallback_enabled: bool = True
-) -> Union[AudioData, bool, None]:
+) -> Union[AudioData, bool, Future]:
     """
     Unified recording function that supports all recording modes.
     
     Args:
         duration: Recording duration in seconds
         target: None for system-wide, process name (str), or PID (int)
-        output_file: If specified, save directly to file and return bool
-        on_complete: If specified, run asynchronously and call callback with result
+        output_file: If specified (path or writable binary file object), save directly
+            to it and return bool
+        on_complete: If specified, run asynchronously on a daemon thread and call
+            callback with result
         fallback_enabled: If True, fallback to native recorder on failure
         
     Returns:
-        - If callback is specified: None (async execution)
+        - If callback is specified: Future resolving to the AudioData (async execution)
         - If filename is specified: bool (success/failure)
         - Otherwise: AudioData object
         
@@ -170,17 +204,16 @@ def record(
         >>> # New: Async process recording
         >>> record(5, target="spotify", on_complete=handle_audio)
     """
-    # If callback is specified, run asynchronously
+    # If callback is specified, run asynchronously on a daemon thread
     if on_complete is not None:
         def _async_record():
             # Recursive call without callback for sync execution
             audio = record(duration, target, output_file=None, on_complete=None, fallback_enabled=fallback_enabled)
             if audio is not None and isinstance(audio, AudioData):
                 on_complete(audio)
+            return audio
         
-        thread = threading.Thread(target=_async_record, daemon=True)
-        thread.start()
-        return None
+        return _run_async(_async_record)
     
     # Resolve target to PID
     pid = _get_target_pid(target)
@@ -263,15 +296,18 @@ class UnifiedRecorder:
         """
         return record(duration, self.target, output_file=filename)
     
-    def record_async(self, duration: float, callback: Callable[[AudioData], None]) -> None:
+    def record_async(self, duration: float, callback: Callable[[AudioData], None]) -> Future:
         """
         Asynchronous recording with callback.
         
         Args:
             duration: Recording duration in seconds
             callback: Function called with AudioData when complete
+            
+        Returns:
+            Future resolving to the recorded AudioData
         """
-        record(duration, self.target, on_complete=callback)
+        return record(duration, self.target, on_complete=callback)
     
     def is_available(self) -> bool:
         """
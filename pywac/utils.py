@@ -4,27 +4,31 @@ Utility functions for PyWAC.
 
 import wave
 import struct
+import warnings
 from typing import List, Tuple, Union
 import numpy as np
+from ._kernels import rms_peak
 
 
-def convert_float32_to_int16(audio_data: List[float]) -> List[int]:
+# Deprecation messages for the legacy WAV helpers (built once, not per call)
+_SAVE_TO_WAV_DEPRECATED = "save_to_wav is deprecated. Use AudioData.save() instead."
+_LOAD_WAV_DEPRECATED = "load_wav is deprecated. Use AudioData.load() instead."
+
+
+def convert_float32_to_int16(audio_data: Union[List[float], np.ndarray]) -> np.ndarray:
     """
     Convert float32 audio data to int16.
     
     Args:
-        audio_data: List of float32 audio samples (-1.0 to 1.0)
+        audio_data: List or array of float32 audio samples (-1.0 to 1.0)
         
     Returns:
-        List of int16 audio samples (-32768 to 32767)
+        Array of int16 audio samples (-32767 to 32767)
     """
-    int16_data = []
-    for sample in audio_data:
-        # Clip to [-1, 1] range
-        sample = max(-1.0, min(1.0, sample))
-        # Convert to int16
-        int16_data.append(int(sample * 32767))
-    return int16_data
+    # Scale into a new buffer (never the caller's), then clip in place
+    scaled = np.multiply(np.asarray(audio_data, dtype=np.float32), np.float32(32767.0))
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
 
 
 def save_to_wav(audio_data: Union[List[float], np.ndarray], 
@@ -43,12 +47,7 @@ def save_to_wav(audio_data: Union[List[float], np.ndarray],
         sample_rate: Sample rate in Hz
         channels: Number of channels
     """
-    import warnings
-    warnings.warn(
-        "save_to_wav is deprecated. Use AudioData.save() instead.",
-        DeprecationWarning,
-        stacklevel=2
-    )
+    warnings.warn(_SAVE_TO_WAV_DEPRECATED, DeprecationWarning, stacklevel=2)
     # Convert to list if numpy array
     if hasattr(audio_data, 'tolist'):
         audio_data = audio_data.tolist()
@@ -81,7 +80,7 @@ def save_to_wav(audio_data: Union[List[float], np.ndarray],
         
         # Pack audio data as bytes
         if len(audio_int16) > 0:
-            packed_data = struct.pack('<%dh' % len(audio_int16), *audio_int16)
+            packed_data = np.asarray(audio_int16, dtype='<i2').tobytes()
             wav_file.writeframes(packed_data)
 
 
@@ -98,12 +97,7 @@ def load_wav(filename: str) -> Tuple[List[float], int, int]:
     Returns:
         Tuple of (audio_data, sample_rate, channels)
     """
-    import warnings
-    warnings.warn(
-        "load_wav is deprecated. Use AudioData.load() instead.",
-        DeprecationWarning,
-        stacklevel=2
-    )
+    warnings.warn(_LOAD_WAV_DEPRECATED, DeprecationWarning, stacklevel=2)
     with wave.open(filename, 'rb') as wav_file:
         channels = wav_file.getnchannels()
         sample_rate = wav_file.getframerate()
@@ -144,7 +138,7 @@ def calculate_rms(audio_data) -> float:
         return 0.0
     
     # Calculate RMS
-    return np.sqrt(np.mean(audio_data ** 2))
+    return rms_peak(audio_data)[0]
 
 
 def calculate_db(audio_data) -> float:
@@ -167,7 +161,7 @@ def calculate_db(audio_data) -> float:
         return -float('inf')
     
     # Calculate RMS
-    rms = np.sqrt(np.mean(audio_data ** 2))
+    rms = rms_peak(audio_data)[0]
     
     if rms == 0:
         return -float('inf')
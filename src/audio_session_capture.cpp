@@ -12,7 +12,9 @@
 #include <string>
 #include <map>
 #include <mutex>
+#include <atomic>
 #include <memory>
+#include <cstring>
 #include <psapi.h>
 #include <tlhelp32.h>
 
@@ -34,11 +36,81 @@ struct AudioSessionInfo {
     bool muted;
 };
 
+// Counts session/device change notifications so callers can tell when a
+// cached session list is stale without re-enumerating
+class SessionChangeNotifier : public IAudioSessionNotification, public IMMNotificationClient {
+private:
+    std::atomic<LONG> refCount{1};
+    std::atomic<unsigned long long> changeCount{0};
+    
+public:
+    unsigned long long GetChangeCount() const {
+        return changeCount.load(std::memory_order_acquire);
+    }
+    
+    // IUnknown
+    STDMETHODIMP QueryInterface(REFIID riid, void** ppv) override {
+        if (!ppv) return E_POINTER;
+        if (riid == __uuidof(IUnknown) || riid == __uuidof(IAudioSessionNotification)) {
+            *ppv = static_cast<IAudioSessionNotification*>(this);
+        } else if (riid == __uuidof(IMMNotificationClient)) {
+            *ppv = static_cast<IMMNotificationClient*>(this);
+        } else {
+            *ppv = nullptr;
+            return E_NOINTERFACE;
+        }
+        AddRef();
+        return S_OK;
+    }
+    
+    STDMETHODIMP_(ULONG) AddRef() override {
+        return ++refCount;
+    }
+    
+    STDMETHODIMP_(ULONG) Release() override {
+        LONG count = --refCount;
+        if (count == 0) delete this;
+        return count;
+    }
+    
+    // IAudioSessionNotification
+    STDMETHODIMP OnSessionCreated(IAudioSessionControl*) override {
+        changeCount.fetch_add(1, std::memory_order_release);
+        return S_OK;
+    }
+    
+    // IMMNotificationClient
+    STDMETHODIMP OnDeviceStateChanged(LPCWSTR, DWORD) override {
+        changeCount.fetch_add(1, std::memory_order_release);
+        return S_OK;
+    }
+    
+    STDMETHODIMP OnDeviceAdded(LPCWSTR) override {
+        changeCount.fetch_add(1, std::memory_order_release);
+        return S_OK;
+    }
+    
+    STDMETHODIMP OnDeviceRemoved(LPCWSTR) override {
+        changeCount.fetch_add(1, std::memory_order_release);
+        return S_OK;
+    }
+    
+    STDMETHODIMP OnDefaultDeviceChanged(EDataFlow, ERole, LPCWSTR) override {
+        changeCount.fetch_add(1, std::memory_order_release);
+        return S_OK;
+    }
+    
+    STDMETHODIMP OnPropertyValueChanged(LPCWSTR, const PROPERTYKEY) override {
+        return S_OK;
+    }
+};
+
 class AudioSessionEnumerator {
 private:
     ComPtr<IMMDeviceEnumerator> deviceEnumerator;
     ComPtr<IMMDevice> defaultDevice;
     ComPtr<IAudioSessionManager2> sessionManager;
+    ComPtr<SessionChangeNotifier> changeNotifier;
     std::vector<AudioSessionInfo> sessions;
     bool comInitialized = false;
     
@@ -55,6 +127,20 @@ public:
     }
     
     ~AudioSessionEnumerator() {
+        // Unregister and release COM objects before uninitializing COM
+        if (changeNotifier) {
+            if (sessionManager) {
+                sessionManager->UnregisterSessionNotification(changeNotifier.Get());
+            }
+            if (deviceEnumerator) {
+                deviceEnumerator->UnregisterEndpointNotificationCallback(changeNotifier.Get());
+            }
+            changeNotifier.Reset();
+        }
+        sessionManager.Reset();
+        defaultDevice.Reset();
+        deviceEnumerator.Reset();
+        
         if (comInitialized) {
             CoUninitialize();
         }
@@ -81,7 +167,26 @@ public:
             CLSCTX_ALL, nullptr,
             reinterpret_cast<void**>(sessionManager.GetAddressOf()));
         
-        return SUCCEEDED(hr);
+        if (FAILED(hr)) return false;
+        
+        RegisterChangeNotifications();
+        return true;
+    }
+    
+    void RegisterChangeNotifications() {
+        changeNotifier.Attach(new SessionChangeNotifier());
+        
+        deviceEnumerator->RegisterEndpointNotificationCallback(changeNotifier.Get());
+        
+        // Session notifications are only delivered once the session list
+        // has been requested at least once
+        ComPtr<IAudioSessionEnumerator> sessionEnumerator;
+        sessionManager->GetSessionEnumerator(&sessionEnumerator);
+        sessionManager->RegisterSessionNotification(changeNotifier.Get());
+    }
+    
+    unsigned long long GetChangeCount() const {
+        return changeNotifier ? changeNotifier->GetChangeCount() : 0;
     }
     
     std::vector<AudioSessionInfo> EnumerateSessions() {
@@ -246,8 +351,8 @@ class SimpleLoopbackCapture {
 private:
     ComPtr<IAudioClient> audioClient;
     ComPtr<IAudioCaptureClient> captureClient;
-    std::vector<float> buffer;
-    std::mutex bufferMutex;
+    std::wstring deviceId;   // endpoint audioClient was activated on
+    std::mutex bufferMutex;  // serializes draining of captureClient
     bool isCapturing = false;
     bool comInitialized = false;
     
@@ -273,7 +378,8 @@ public:
         
         HRESULT hr;
         
-        // Get default audio device
+        // Get default audio device (looked up on every start so a changed
+        // default output is picked up)
         ComPtr<IMMDeviceEnumerator> deviceEnumerator;
         hr = CoCreateInstance(__uuidof(MMDeviceEnumerator), nullptr,
             CLSCTX_ALL, __uuidof(IMMDeviceEnumerator),
@@ -287,10 +393,37 @@ public:
         
         if (FAILED(hr)) return false;
         
+        std::wstring currentId;
+        LPWSTR id = nullptr;
+        if (SUCCEEDED(device->GetId(&id)) && id) {
+            currentId = id;
+            CoTaskMemFree(id);
+        }
+        
+        // Restart an already initialized client on the same endpoint: drop
+        // audio buffered since the last Stop() and skip device activation
+        if (audioClient && captureClient) {
+            hr = E_FAIL;
+            if (!currentId.empty() && currentId == deviceId) {
+                hr = audioClient->Reset();
+                if (SUCCEEDED(hr)) {
+                    hr = audioClient->Start();
+                }
+            }
+            if (SUCCEEDED(hr)) {
+                isCapturing = true;
+                return true;
+            }
+            // Default device changed or client invalidated: full re-init
+            captureClient.Reset();
+            audioClient.Reset();
+            deviceId.clear();
+        }
+        
         // Activate audio client
         hr = device->Activate(__uuidof(IAudioClient),
             CLSCTX_ALL, nullptr,
-            reinterpret_cast<void**>(audioClient.GetAddressOf()));
+            reinterpret_cast<void**>(audioClient.ReleaseAndGetAddressOf()));
         
         if (FAILED(hr)) return false;
         
@@ -311,7 +444,7 @@ public:
         
         // Get capture client
         hr = audioClient->GetService(__uuidof(IAudioCaptureClient),
-            reinterpret_cast<void**>(captureClient.GetAddressOf()));
+            reinterpret_cast<void**>(captureClient.ReleaseAndGetAddressOf()));
         
         if (FAILED(hr)) return false;
         
@@ -319,6 +452,7 @@ public:
         hr = audioClient->Start();
         if (FAILED(hr)) return false;
         
+        deviceId = currentId;
         isCapturing = true;
         return true;
     }
@@ -330,18 +464,15 @@ public:
         }
     }
     
-    py::array_t<float> GetBuffer() {
-        if (!isCapturing || !captureClient) {
-            return py::array_t<float>(0);
-        }
-        
-        std::lock_guard<std::mutex> lock(bufferMutex);
-        buffer.clear();
-        
+    // Pop WASAPI packets while fits(frames) allows, passing non-silent
+    // interleaved stereo float data to consume(data, frames). A packet that
+    // doesn't fit stays queued for the next call. Caller holds bufferMutex.
+    template <typename Fits, typename Consume>
+    void DrainPackets(Fits fits, Consume consume) {
         UINT32 packetLength = 0;
         HRESULT hr = captureClient->GetNextPacketSize(&packetLength);
         
-        while (SUCCEEDED(hr) && packetLength > 0) {
+        while (SUCCEEDED(hr) && packetLength > 0 && fits(packetLength)) {
             BYTE* data = nullptr;
             UINT32 numFramesAvailable;
             DWORD flags;
@@ -353,10 +484,7 @@ public:
             if (SUCCEEDED(hr)) {
                 if (!(flags & AUDCLNT_BUFFERFLAGS_SILENT)) {
                     // Assuming float format
-                    float* floatData = reinterpret_cast<float*>(data);
-                    buffer.insert(buffer.end(), 
-                        floatData, 
-                        floatData + numFramesAvailable * 2); // stereo
+                    consume(reinterpret_cast<const float*>(data), numFramesAvailable);
                 }
                 
                 captureClient->ReleaseBuffer(numFramesAvailable);
@@ -364,12 +492,65 @@ public:
             
             hr = captureClient->GetNextPacketSize(&packetLength);
         }
+    }
+    
+    py::array_t<float> GetBuffer() {
+        if (!isCapturing || !captureClient) {
+            return py::array_t<float>(0);
+        }
+        
+        std::vector<float> buffer;
+        {
+            // WASAPI calls don't need the GIL; let other Python threads run
+            py::gil_scoped_release release;
+            std::lock_guard<std::mutex> lock(bufferMutex);
+            
+            DrainPackets(
+                [](UINT32) { return true; },
+                [&buffer](const float* data, UINT32 frames) {
+                    buffer.insert(buffer.end(), data, data + frames * 2); // stereo
+                });
+        }
+        
+        // Hand the vector's storage to NumPy instead of copying it; the
+        // capsule frees it when the array is garbage collected
+        auto* owned = new std::vector<float>(std::move(buffer));
+        py::capsule freeWhenDone(owned, [](void* p) {
+            delete static_cast<std::vector<float>*>(p);
+        });
+        return py::array_t<float>(
+            {static_cast<py::ssize_t>(owned->size())},
+            {static_cast<py::ssize_t>(sizeof(float))},
+            owned->data(),
+            freeWhenDone);
+    }
+    
+    // Read captured samples straight into a caller-owned float32 array.
+    // Bound with noconvert(): a converted temporary would swallow the
+    // drained packets while the returned count claims they were delivered.
+    size_t GetBufferInto(py::array_t<float, py::array::c_style> out) {
+        if (!out.writeable()) {
+            throw py::value_error("out must be a writeable float32 array");
+        }
+        if (!isCapturing || !captureClient) {
+            return 0;
+        }
+        
+        float* dst = out.mutable_data();
+        size_t capacity = static_cast<size_t>(out.size());
+        size_t written = 0;
+        
+        py::gil_scoped_release release;
+        std::lock_guard<std::mutex> lock(bufferMutex);
         
-        auto result = py::array_t<float>(buffer.size());
-        auto ptr = static_cast<float*>(result.mutable_unchecked<1>().mutable_data(0));
-        std::copy(buffer.begin(), buffer.end(), ptr);
+        DrainPackets(
+            [&](UINT32 frames) { return written + static_cast<size_t>(frames) * 2 <= capacity; },
+            [&](const float* data, UINT32 frames) {
+                std::memcpy(dst + written, data, frames * 2 * sizeof(float)); // stereo
+                written += static_cast<size_t>(frames) * 2;
+            });
         
-        return result;
+        return written;
     }
 };
 
@@ -390,7 +571,9 @@ PYBIND11_MODULE(core, m) {
              "Enumerate all audio sessions")
         .def("set_session_volume", &AudioSessionEnumerator::SetSessionVolume,
              "Set volume for a specific process",
-             py::arg("process_id"), py::arg("volume"));
+             py::arg("process_id"), py::arg("volume"))
+        .def("get_change_count", &AudioSessionEnumerator::GetChangeCount,
+             "Number of session/device change notifications received");
     
     py::class_<SimpleLoopbackCapture>(m, "SimpleLoopback")
         .def(py::init<>())
@@ -398,6 +581,11 @@ PYBIND11_MODULE(core, m) {
              "Start system-wide loopback capture")
         .def("stop", &SimpleLoopbackCapture::Stop,
              "Stop capture")
+        .def("get_buffer", &SimpleLoopbackCapture::GetBufferInto,
+             "Read captured audio into a preallocated float32 array; "
+             "returns the number of samples written. out must be a writeable, "
+             "C-contiguous float32 array; it is never converted",
+             py::arg("out").noconvert())
         .def("get_buffer", &SimpleLoopbackCapture::GetBuffer,
              "Get captured audio buffer");
     
@@ -22,7 +22,7 @@
 #include <wrl/client.h>
 
 #include <vector>
-#include <queue>
+#include <map>
 #include <string>
 #include <thread>
 #include <atomic>
@@ -64,95 +64,119 @@ struct AudioChunk {
     }
 };
 
-// Thread-safe audio queue implementation
-class ThreadSafeAudioQueue {
+// Single-producer/single-consumer ring of preallocated audio chunks.
+//
+// The capture thread (producer) fills slots in place and publishes them
+// with a release store of `tail`; Python (consumer) reads published slots
+// and hands them back with a release store of `head`. Neither side takes
+// a lock or allocates while capturing. When the ring is full the newest
+// chunk is dropped, since the producer may not touch slots the consumer
+// owns.
+class SpscAudioRing {
 private:
-    std::queue<AudioChunk> queue;
-    mutable std::mutex mutex;
-    std::condition_variable cv;
+    std::vector<AudioChunk> slots;
+    size_t capacity = 0;
+    size_t chunkFrames = 0;
+    
+    alignas(64) std::atomic<size_t> head{0};  // next slot to read (consumer)
+    alignas(64) std::atomic<size_t> tail{0};  // next slot to write (producer)
     
-    size_t maxSize;
-    size_t totalChunks = 0;
-    size_t droppedChunks = 0;
+    std::atomic<size_t> totalChunks{0};
+    std::atomic<size_t> droppedChunks{0};
     std::atomic<bool> closed{false};
     
+    // Auto-reset event used only to wake a waiting consumer
+    HANDLE dataEvent = nullptr;
+    
 public:
-    ThreadSafeAudioQueue(size_t max_size = 1000) : maxSize(max_size) {}
+    SpscAudioRing(size_t max_size = 1000) : capacity(max_size) {
+        dataEvent = CreateEvent(nullptr, FALSE, FALSE, nullptr);
+    }
     
-    // Producer side - called from C++ capture thread
-    bool push(AudioChunk&& chunk) {
-        std::unique_lock<std::mutex> lock(mutex);
-        
-        if (closed) return false;
-        
-        // Drop oldest if queue is full
-        if (queue.size() >= maxSize) {
-            queue.pop();
-            droppedChunks++;
+    ~SpscAudioRing() {
+        if (dataEvent) {
+            CloseHandle(dataEvent);
         }
-        
-        queue.push(std::move(chunk));
-        totalChunks++;
-        
-        cv.notify_one();
-        return true;
     }
     
-    // Consumer side - called from Python
-    std::vector<AudioChunk> popBatch(size_t maxChunks = 10, int timeoutMs = 10) {
-        std::unique_lock<std::mutex> lock(mutex);
-        std::vector<AudioChunk> result;
-        
-        // Wait for data or timeout
-        auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeoutMs);
-        cv.wait_until(lock, deadline, [this] { return !queue.empty() || closed; });
-        
-        // Collect up to maxChunks
-        while (!queue.empty() && result.size() < maxChunks) {
-            result.push_back(std::move(queue.front()));
-            queue.pop();
+    SpscAudioRing(const SpscAudioRing&) = delete;
+    SpscAudioRing& operator=(const SpscAudioRing&) = delete;
+    
+    // Preallocate all slots; only call while no capture thread is running
+    void reset(size_t frames) {
+        if (frames != chunkFrames || slots.size() != capacity) {
+            slots.assign(capacity, AudioChunk(frames));
+            chunkFrames = frames;
         }
-        
-        return result;
+        head.store(0, std::memory_order_relaxed);
+        tail.store(0, std::memory_order_relaxed);
+        totalChunks = 0;
+        droppedChunks = 0;
+        closed = false;
+        if (dataEvent) ResetEvent(dataEvent);
     }
     
-    // Get single chunk (for compatibility)
-    std::unique_ptr<AudioChunk> pop(int timeoutMs = 10) {
-        auto batch = popBatch(1, timeoutMs);
-        if (batch.empty()) {
+    // Producer side - called from C++ capture thread.
+    // Returns the slot to fill next, or nullptr if the ring is full.
+    AudioChunk* beginWrite() {
+        size_t t = tail.load(std::memory_order_relaxed);
+        if (t - head.load(std::memory_order_acquire) >= capacity) {
             return nullptr;
         }
-        return std::make_unique<AudioChunk>(std::move(batch[0]));
+        return &slots[t % capacity];
+    }
+    
+    // Producer side - publish the slot returned by beginWrite()
+    void commitWrite() {
+        tail.store(tail.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+        totalChunks++;
+        if (dataEvent) SetEvent(dataEvent);
+    }
+    
+    // Producer side - record a chunk lost because the ring was full
+    void markDropped() {
+        droppedChunks++;
+    }
+    
+    // Consumer side - wait until data is available (or timeout / close)
+    // and return the number of readable chunks
+    size_t waitReadable(int timeoutMs) {
+        size_t available = tail.load(std::memory_order_acquire) - head.load(std::memory_order_relaxed);
+        if (available == 0 && !closed && timeoutMs > 0 && dataEvent) {
+            WaitForSingleObject(dataEvent, static_cast<DWORD>(timeoutMs));
+            available = tail.load(std::memory_order_acquire) - head.load(std::memory_order_relaxed);
+        }
+        return available;
     }
     
-    void clear() {
-        std::unique_lock<std::mutex> lock(mutex);
-        std::queue<AudioChunk> empty;
-        std::swap(queue, empty);
+    // Consumer side - access the i-th readable chunk (i < waitReadable())
+    const AudioChunk& peek(size_t i) const {
+        return slots[(head.load(std::memory_order_relaxed) + i) % capacity];
+    }
+    
+    // Consumer side - return n read chunks to the producer
+    void release(size_t n) {
+        head.store(head.load(std::memory_order_relaxed) + n, std::memory_order_release);
     }
     
     size_t size() const {
-        std::unique_lock<std::mutex> lock(mutex);
-        return queue.size();
+        return tail.load(std::memory_order_acquire) - head.load(std::memory_order_acquire);
     }
     
     bool empty() const {
-        std::unique_lock<std::mutex> lock(mutex);
-        return queue.empty();
+        return size() == 0;
     }
     
     void close() {
-        std::unique_lock<std::mutex> lock(mutex);
         closed = true;
-        cv.notify_all();
+        if (dataEvent) SetEvent(dataEvent);
     }
     
     std::map<std::string, size_t> getStats() const {
-        std::unique_lock<std::mutex> lock(mutex);
         return {
-            {"queue_size", queue.size()},
-            {"total_chunks", totalChunks},
-            {"dropped_chunks", droppedChunks}
+            {"queue_size", size()},
+            {"total_chunks", totalChunks.load()},
+            {"dropped_chunks", droppedChunks.load()}
         };
     }
 };
@@ -213,13 +237,20 @@ private:
     std::atomic<bool> capturing{false};
     std::atomic<bool> shouldStop{false};
     
-    ThreadSafeAudioQueue audioQueue;
+    SpscAudioRing audioQueue;
     size_t chunkSize = 480;  // 10ms at 48kHz
     
+    // The ring has a single consumer, so Python-side readers take turns
+    std::mutex consumerMutex;
+    
+    // Sink for audio that arrives while the ring is full
+    AudioChunk overflowChunk;
+    
     // Event-driven support
     HANDLE audioDataEvent = nullptr;
     HANDLE stopEvent = nullptr;
     bool eventDrivenMode = false;
+    UINT32 enginePeriodFrames = 0;  // Non-zero when IAudioClient3 low-latency init succeeded
     
     // Performance metrics
     std::atomic<size_t> totalFramesCaptured{0};
@@ -254,8 +285,9 @@ private:
         }
         std::cout << ", chunk size: " << chunkSize << " frames" << std::endl;
         
-        // Accumulator for partial chunks
-        AudioChunk currentChunk(chunkSize);
+        // Chunk currently being filled, written in place in the ring
+        AudioChunk* currentChunk = nullptr;
+        bool currentDropped = false;
         size_t currentOffset = 0;
         
         while (!shouldStop) {
@@ -318,19 +350,30 @@ private:
                     size_t sourceOffset = 0;
                     
                     while (framesToProcess > 0) {
+                        if (currentChunk == nullptr) {
+                            // Claim the next ring slot; if the consumer has
+                            // fallen behind, capture into the overflow sink
+                            currentChunk = audioQueue.beginWrite();
+                            currentDropped = (currentChunk == nullptr);
+                            if (currentDropped) {
+                                currentChunk = &overflowChunk;
+                            }
+                            currentChunk->timestamp = std::chrono::steady_clock::now();
+                        }
+                        
                         size_t framesToCopy = (framesToProcess < (chunkSize - currentOffset)) ? framesToProcess : (chunkSize - currentOffset);
                         
                         if (!isSilent && floatData) {
                             // Copy actual audio data
                             std::memcpy(
-                                currentChunk.data.data() + currentOffset * 2,
+                                currentChunk->data.data() + currentOffset * 2,
                                 floatData + sourceOffset * 2,
                                 framesToCopy * 2 * sizeof(float)
                             );
                         } else {
                             // Fill with silence
                             std::memset(
-                                currentChunk.data.data() + currentOffset * 2,
+                                currentChunk->data.data() + currentOffset * 2,
                                 0,
                                 framesToCopy * 2 * sizeof(float)
                             );
@@ -340,13 +383,17 @@ private:
                         sourceOffset += framesToCopy;
                         framesToProcess -= framesToCopy;
                         
-                        // If chunk is full, push to queue
+                        // If chunk is full, publish it
                         if (currentOffset >= chunkSize) {
-                            currentChunk.silent = isSilent;
-                            audioQueue.push(std::move(currentChunk));
+                            currentChunk->frameCount = chunkSize;
+                            currentChunk->silent = isSilent;
+                            if (currentDropped) {
+                                audioQueue.markDropped();
+                            } else {
+                                audioQueue.commitWrite();
+                            }
                             
-                            // Prepare new chunk
-                            currentChunk = AudioChunk(chunkSize);
+                            currentChunk = nullptr;
                             currentOffset = 0;
                         }
                     }
@@ -374,12 +421,17 @@ private:
             }
         }
         
-        // Push any remaining partial chunk
-        if (currentOffset > 0) {
-            currentChunk.frameCount = currentOffset;
-            currentChunk.data.resize(currentOffset * 2);
-            audioQueue.push(std::move(currentChunk));
+        // Publish any remaining partial chunk
+        if (currentChunk != nullptr && currentOffset > 0) {
+            currentChunk->frameCount = currentOffset;
+            currentChunk->silent = false;  // slots are reused; clear the last lap's flag
+            if (currentDropped) {
+                audioQueue.markDropped();
+            } else {
+                audioQueue.commitWrite();
+            }
         }
+        audioQueue.close();
         
         audioClient->Stop();
         
@@ -475,14 +527,37 @@ public:
         DWORD streamFlags = AUDCLNT_STREAMFLAGS_LOOPBACK | AUDCLNT_STREAMFLAGS_EVENTCALLBACK;
         bool tryEventDriven = true;
         
-        // Initialize with event callback flag
-        hr = audioClient->Initialize(
-            AUDCLNT_SHAREMODE_SHARED,
-            streamFlags,
-            0, 0,  // Must be 0 for event-driven
-            &format,
-            nullptr
-        );
+        // Prefer the engine's minimum shared-mode period (IAudioClient3) for lower
+        // latency; older systems and drivers fall back to the default 10ms period
+        enginePeriodFrames = 0;
+        hr = E_NOINTERFACE;
+        ComPtr<IAudioClient3> audioClient3;
+        if (SUCCEEDED(audioClient.As(&audioClient3))) {
+            UINT32 defaultPeriod = 0, fundamentalPeriod = 0, minPeriod = 0, maxPeriod = 0;
+            hr = audioClient3->GetSharedModeEnginePeriod(
+                &format, &defaultPeriod, &fundamentalPeriod, &minPeriod, &maxPeriod);
+            if (SUCCEEDED(hr) && minPeriod > 0) {
+                hr = audioClient3->InitializeSharedAudioStream(streamFlags, minPeriod, &format, nullptr);
+                if (SUCCEEDED(hr)) {
+                    enginePeriodFrames = minPeriod;
+                    std::cout << "Low-latency stream initialized (period: " << std::dec
+                              << minPeriod << " frames)" << std::endl;
+                }
+            } else if (SUCCEEDED(hr)) {
+                hr = E_FAIL;
+            }
+        }
+        
+        if (FAILED(hr)) {
+            // Initialize with event callback flag
+            hr = audioClient->Initialize(
+                AUDCLNT_SHAREMODE_SHARED,
+                streamFlags,
+                0, 0,  // Must be 0 for event-driven
+                &format,
+                nullptr
+            );
+        }
         
         if (FAILED(hr)) {
             // Some systems might not support event-driven with Process Loopback
@@ -550,8 +625,9 @@ public:
             return false;
         }
         
-        // Clear queue and reset metrics
-        audioQueue.clear();
+        // Preallocate the chunk ring and reset metrics
+        audioQueue.reset(chunkSize);
+        overflowChunk = AudioChunk(chunkSize);
         totalFramesCaptured = 0;
         totalSilentFrames = 0;
         captureErrors = 0;
@@ -574,7 +650,6 @@ public:
         }
         
         shouldStop = true;
-        audioQueue.close();
         
         // Signal stop event if in event-driven mode
         if (stopEvent) {
@@ -600,48 +675,56 @@ public:
     }
     
     // Python interface methods
+    
+    // Copy a ring slot into a new numpy-backed chunk dictionary
+    static py::dict chunkToDict(const AudioChunk& chunk) {
+        py::array_t<float> arr({static_cast<py::ssize_t>(chunk.frameCount), static_cast<py::ssize_t>(2)});
+        auto ptr = static_cast<float*>(arr.mutable_unchecked<2>().mutable_data(0, 0));
+        std::memcpy(ptr, chunk.data.data(), chunk.frameCount * 2 * sizeof(float));
+        
+        py::dict chunkDict;
+        chunkDict["data"] = arr;
+        chunkDict["silent"] = chunk.silent;
+        chunkDict["timestamp"] = std::chrono::duration_cast<std::chrono::microseconds>(
+            chunk.timestamp.time_since_epoch()).count();
+        return chunkDict;
+    }
+    
+    // Take the consumer lock and wait for data; the returned lock must be held
+    // until the peeked chunks are released. Without it, two Python threads
+    // could read the same count while the GIL is dropped and move head past tail.
+    std::unique_lock<std::mutex> waitReadable(int timeoutMs, size_t& available) {
+        // Don't hold the GIL while waiting for the lock or the capture thread
+        py::gil_scoped_release release;
+        std::unique_lock<std::mutex> lock(consumerMutex);
+        available = audioQueue.waitReadable(timeoutMs);
+        return lock;
+    }
+    
     py::list popChunks(size_t maxChunks = 10, int timeoutMs = 10) {
         py::list result;
         
-        auto chunks = audioQueue.popBatch(maxChunks, timeoutMs);
+        size_t available = 0;
+        auto lock = waitReadable(timeoutMs, available);
+        size_t count = (available < maxChunks) ? available : maxChunks;
         
-        for (auto& chunk : chunks) {
-            // Create numpy array from chunk data
-            py::array_t<float> arr({static_cast<py::ssize_t>(chunk.frameCount), static_cast<py::ssize_t>(2)});
-            auto ptr = static_cast<float*>(arr.mutable_unchecked<2>().mutable_data(0, 0));
-            std::memcpy(ptr, chunk.data.data(), chunk.frameCount * 2 * sizeof(float));
-            
-            // Create dictionary with chunk metadata
-            py::dict chunkDict;
-            chunkDict["data"] = arr;
-            chunkDict["silent"] = chunk.silent;
-            chunkDict["timestamp"] = std::chrono::duration_cast<std::chrono::microseconds>(
-                chunk.timestamp.time_since_epoch()).count();
-            
-            result.append(chunkDict);
+        for (size_t i = 0; i < count; i++) {
+            result.append(chunkToDict(audioQueue.peek(i)));
         }
+        audioQueue.release(count);
         
         return result;
     }
     
     py::object popChunk(int timeoutMs = 10) {
-        auto chunk = audioQueue.pop(timeoutMs);
-        
-        if (!chunk) {
+        size_t available = 0;
+        auto lock = waitReadable(timeoutMs, available);
+        if (available == 0) {
             return py::none();
         }
         
-        // Create numpy array
-        py::array_t<float> arr({static_cast<py::ssize_t>(chunk->frameCount), static_cast<py::ssize_t>(2)});
-        auto ptr = static_cast<float*>(arr.mutable_unchecked<2>().mutable_data(0, 0));
-        std::memcpy(ptr, chunk->data.data(), chunk->frameCount * 2 * sizeof(float));
-        
-        // Create dictionary with chunk metadata
-        py::dict chunkDict;
-        chunkDict["data"] = arr;
-        chunkDict["silent"] = chunk->silent;
-        chunkDict["timestamp"] = std::chrono::duration_cast<std::chrono::microseconds>(
-            chunk->timestamp.time_since_epoch()).count();
+        py::dict chunkDict = chunkToDict(audioQueue.peek(0));
+        audioQueue.release(1);
         
         return chunkDict;
     }
@@ -671,6 +754,7 @@ public:
         metrics["dropped_chunks"] = queueStats["dropped_chunks"];
         metrics["chunk_size"] = chunkSize;
         metrics["event_driven"] = eventDrivenMode;
+        metrics["engine_period_frames"] = enginePeriodFrames;
         metrics["event_signals"] = eventSignals.load();
         metrics["timeouts"] = timeouts.load();
         
@@ -682,39 +766,70 @@ public:
     }
 };
 
+static std::string queryProcessBaseName(HANDLE hProcess) {
+    wchar_t path[MAX_PATH];
+    DWORD size = MAX_PATH;
+    if (!QueryFullProcessImageNameW(hProcess, 0, path, &size)) {
+        return std::string();
+    }
+    
+    // Extract filename from full path
+    const wchar_t* base = path;
+    for (DWORD i = 0; i < size; i++) {
+        if (path[i] == L'\\' || path[i] == L'/') {
+            base = path + i + 1;
+        }
+    }
+    int baseLen = static_cast<int>(size - (base - path));
+    
+    int len = WideCharToMultiByte(CP_UTF8, 0, base, baseLen, nullptr, 0, nullptr, nullptr);
+    std::string name(len, '\0');
+    WideCharToMultiByte(CP_UTF8, 0, base, baseLen, &name[0], len, nullptr, nullptr);
+    return name;
+}
+
 // Helper function to list audio processes
 std::vector<ProcessInfo> listAudioProcesses() {
     std::vector<ProcessInfo> processes;
     
-    // Get all process IDs
-    DWORD processIds[1024];
-    DWORD bytesReturned;
+    // Get all process IDs, growing the buffer until it holds them all
+    std::vector<DWORD> processIds(1024);
+    DWORD bytesReturned = 0;
+    while (true) {
+        DWORD bufferBytes = static_cast<DWORD>(processIds.size() * sizeof(DWORD));
+        if (!EnumProcesses(processIds.data(), bufferBytes, &bytesReturned)) {
+            return processes;
+        }
+        if (bytesReturned < bufferBytes) {
+            break;
+        }
+        processIds.resize(processIds.size() * 2);
+    }
+    DWORD processCount = bytesReturned / sizeof(DWORD);
+    processes.reserve(processCount);
     
-    if (EnumProcesses(processIds, sizeof(processIds), &bytesReturned)) {
-        DWORD processCount = bytesReturned / sizeof(DWORD);
+    for (DWORD i = 0; i < processCount; i++) {
+        DWORD pid = processIds[i];
+        if (pid == 0) {
+            continue;
+        }
         
-        for (DWORD i = 0; i < processCount; i++) {
-            if (processIds[i] != 0) {
-                HANDLE hProcess = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, FALSE, processIds[i]);
-                
-                if (hProcess) {
-                    char processName[MAX_PATH] = "";
-                    HMODULE hMod;
-                    DWORD cbNeeded;
-                    
-                    if (EnumProcessModules(hProcess, &hMod, sizeof(hMod), &cbNeeded)) {
-                        GetModuleBaseNameA(hProcess, hMod, processName, sizeof(processName));
-                        
-                        // Filter common audio-producing processes
-                        std::string name(processName);
-                        if (!name.empty() && name != "System" && name != "Registry") {
-                            processes.emplace_back(processIds[i], name);
-                        }
-                    }
-                    
-                    CloseHandle(hProcess);
-                }
-            }
+        // Limited rights suffice for the image name (and work for more processes)
+        HANDLE hProcess = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, FALSE, pid);
+        if (!hProcess) {
+            continue;
+        }
+        
+        std::string name = queryProcessBaseName(hProcess);
+        CloseHandle(hProcess);
+        
+        if (name.empty()) {
+            continue;
+        }
+        
+        // Filter common audio-producing processes
+        if (name != "System" && name != "Registry") {
+            processes.emplace_back(pid, name);
         }
     }
     
@@ -757,5 +872,6 @@ PYBIND11_MODULE(capture, m) {
     
     // Module functions
     m.def("list_audio_processes", &listAudioProcesses,
+          py::call_guard<py::gil_scoped_release>(),
           "List all processes that might produce audio");
 }
\ No newline at end of file
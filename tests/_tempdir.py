@@ -0,0 +1,33 @@
+"""
+Private temporary directory shared by the test modules for their output files.
+"""
+
+import os
+import atexit
+import shutil
+import tempfile
+import threading
+
+_tmpdir = None
+_tmpdir_lock = threading.Lock()
+
+
+def tmp_path(filename):
+    """
+    Return the path of a test output file inside the private temp directory.
+
+    The directory is created on first use (not at import, so test collection
+    leaves nothing behind) and removed when the interpreter exits.
+
+    Args:
+        filename: File name inside the directory
+
+    Returns:
+        Absolute path as a string
+    """
+    global _tmpdir
+    with _tmpdir_lock:
+        if _tmpdir is None:
+            _tmpdir = tempfile.mkdtemp(prefix='pywac_test_')
+            atexit.register(shutil.rmtree, _tmpdir, ignore_errors=True)
+    return os.path.join(_tmpdir, filename)
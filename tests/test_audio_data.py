@@ -3,10 +3,17 @@ Tests for AudioData class
 """
 
 import unittest
+import io
 import numpy as np
 import tempfile
 import os
+import weakref
 from pywac.audio_data import AudioData
+from pywac.utils import rms_peak
+
+
+# Seeded generator: reproducible fixtures, generated directly as float32
+rng = np.random.default_rng(0)
 
 
 class TestAudioData(unittest.TestCase):
@@ -15,7 +22,7 @@ class TestAudioData(unittest.TestCase):
     def test_create_from_samples(self):
         """Test creating AudioData from samples"""
         # Mono audio
-        samples_mono = np.random.randn(1000).astype(np.float32)
+        samples_mono = rng.standard_normal(1000, dtype=np.float32)
         audio = AudioData(samples_mono, 48000, 1)
         self.assertEqual(audio.num_frames, 1000)
         self.assertEqual(audio.channels, 1)
@@ -23,20 +30,26 @@ class TestAudioData(unittest.TestCase):
         self.assertAlmostEqual(audio.duration, 1000/48000)
         
         # Stereo audio
-        samples_stereo = np.random.randn(1000, 2).astype(np.float32)
+        samples_stereo = rng.standard_normal((1000, 2), dtype=np.float32)
         audio = AudioData(samples_stereo, 48000, 2)
         self.assertEqual(audio.num_frames, 1000)
         self.assertEqual(audio.channels, 2)
+        
+        # Instances stay weak-referenceable despite __slots__
+        self.assertIs(weakref.ref(audio)(), audio)
     
     def test_create_from_interleaved(self):
         """Test creating AudioData from interleaved data"""
         # Interleaved stereo data [L0, R0, L1, R1, ...]
-        interleaved = np.random.randn(2000).astype(np.float32)
+        interleaved = rng.standard_normal(2000, dtype=np.float32)
         audio = AudioData.from_interleaved(interleaved, 48000, 2)
         
         self.assertEqual(audio.num_frames, 1000)
         self.assertEqual(audio.channels, 2)
         self.assertEqual(audio.samples.shape, (1000, 2))
+        
+        # Contiguous input is wrapped as a view, not copied
+        self.assertTrue(np.shares_memory(audio.samples, interleaved))
     
     def test_to_float32(self):
         """Test conversion to float32"""
@@ -88,6 +101,12 @@ class TestAudioData(unittest.TestCase):
         self.assertEqual(mono.channels, 1)
         np.testing.assert_array_almost_equal(mono.samples, np.array([2, 3], dtype=np.float32))
         
+        # int16 stereo keeps its dtype and does not overflow
+        samples_int16 = np.array([[32767, 32767], [-32768, -32768]], dtype=np.int16)
+        mono = AudioData(samples_int16, 48000, 2).to_mono()
+        self.assertEqual(mono.dtype, np.int16)
+        np.testing.assert_array_equal(mono.samples, np.array([32767, -32768], dtype=np.int16))
+        
         # Already mono
         samples_mono = np.array([1, 2, 3], dtype=np.float32)
         audio = AudioData(samples_mono, 48000, 1)
@@ -98,7 +117,7 @@ class TestAudioData(unittest.TestCase):
     def test_save_and_load(self):
         """Test saving and loading WAV files"""
         # Create test audio
-        samples = np.random.randn(1000, 2).astype(np.float32) * 0.5
+        samples = rng.standard_normal((1000, 2), dtype=np.float32) * 0.5
         audio = AudioData(samples, 48000, 2)
         
         # Save to temporary file
@@ -131,6 +150,75 @@ class TestAudioData(unittest.TestCase):
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
     
+    def test_load_mmap(self):
+        """Test loading a WAV file as a memory map"""
+        samples = rng.standard_normal((1000, 2), dtype=np.float32) * 0.5
+        audio = AudioData(samples, 48000, 2)
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            audio.save(temp_path)
+            
+            mapped = AudioData.load(temp_path, use_mmap=True)
+            self.assertIsInstance(mapped.samples, np.memmap)
+            self.assertEqual(mapped, AudioData.load(temp_path))
+            
+            # Release the mapping so the file can be removed on Windows
+            del mapped
+            
+        finally:
+            # Clean up
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+    
+    def test_save_load_file_object(self):
+        """Test saving to and loading from an in-memory file"""
+        audio = AudioData(rng.standard_normal((1000, 2), dtype=np.float32) * 0.5, 48000, 2)
+        
+        buffer = io.BytesIO()
+        audio.save(buffer)
+        buffer.seek(0)
+        loaded = AudioData.load(buffer)
+        
+        self.assertEqual(loaded, audio.to_int16())
+        self.assertFalse(buffer.closed)
+        with self.assertRaises(ValueError):
+            AudioData.load(io.BytesIO(buffer.getvalue()), use_mmap=True)
+    
+    def test_load_cache(self):
+        """Test that reloading an unchanged file is served from the cache"""
+        audio = AudioData(rng.standard_normal((1000, 2), dtype=np.float32) * 0.5, 48000, 2)
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            audio.save(temp_path)
+            first = AudioData.load(temp_path)
+            second = AudioData.load(temp_path)
+            self.assertEqual(first, second)
+            self.assertTrue(np.shares_memory(first.samples, second.samples))
+            self.assertFalse(second.samples.flags.writeable)
+            
+            # Rewriting the file (same size) must not return stale data
+            other = AudioData(-audio.samples, 48000, 2)
+            other.save(temp_path)
+            reloaded = AudioData.load(temp_path)
+            self.assertEqual(reloaded, other.to_int16())
+            
+            # Clearing the cache forces a fresh read
+            AudioData.clear_load_cache()
+            fresh = AudioData.load(temp_path)
+            self.assertEqual(fresh, reloaded)
+            self.assertFalse(np.shares_memory(fresh.samples, reloaded.samples))
+            
+        finally:
+            # Clean up
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+    
     def test_get_statistics(self):
         """Test audio statistics calculation"""
         # Create test signal
@@ -150,6 +238,17 @@ class TestAudioData(unittest.TestCase):
         self.assertAlmostEqual(stats['rms'], expected_rms, places=4)
         self.assertAlmostEqual(stats['peak'], 0.5, places=4)
     
+    def test_rms_peak(self):
+        """Test single-pass RMS/peak kernel"""
+        samples = rng.standard_normal((1000, 2), dtype=np.float32)
+        rms, peak = rms_peak(samples)
+        self.assertAlmostEqual(rms, float(np.sqrt(np.mean(samples.astype(np.float64) ** 2))), places=5)
+        self.assertAlmostEqual(peak, float(np.max(np.abs(samples))), places=6)
+        
+        # Integer input must not overflow
+        self.assertEqual(rms_peak(np.array([-32768, 32767], dtype=np.int16))[1], 32768.0)
+        self.assertEqual(rms_peak(np.array([], dtype=np.float32)), (0.0, 0.0))
+    
     def test_equality(self):
         """Test AudioData equality comparison"""
         samples1 = np.array([1, 2, 3], dtype=np.float32)
@@ -3,11 +3,14 @@ Tests for example codes to ensure they work correctly
 """
 
 import unittest
+import io
 import sys
 import os
 import time
+import itertools
 import tempfile
 import threading
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -17,6 +20,19 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pywac
 from pywac.audio_data import AudioData
 import numpy as np
+from _tempdir import tmp_path
+
+_temp_counter = itertools.count()
+
+
+@contextmanager
+def temp_wav_path():
+    """Yield a fresh (not yet created) WAV path, deleting it afterwards"""
+    path = Path(tmp_path(f"test_{next(_temp_counter)}.wav"))
+    try:
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
 
 
 class TestBasicUsageExample(unittest.TestCase):
@@ -64,23 +80,16 @@ class TestBasicUsageExample(unittest.TestCase):
     
     def test_record_to_file(self):
         """Test recording directly to file"""
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            temp_path = f.name
-        
-        try:
+        with temp_wav_path() as temp_path:
             # Record to file
             success = pywac.record_to_file(temp_path, 0.1)
             self.assertTrue(success)
-            self.assertTrue(os.path.exists(temp_path))
+            self.assertTrue(temp_path.exists())
             
             # Load and verify
             audio = AudioData.load(temp_path)
             self.assertEqual(audio.sample_rate, 48000)
             self.assertGreaterEqual(audio.duration, 0.08)  # Allow more tolerance
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
     
     def test_volume_control(self):
         """Test volume control functions"""
@@ -116,7 +125,7 @@ class TestBasicUsageExample(unittest.TestCase):
             callback_called.set()
         
         # Start callback recording
-        pywac.record_with_callback(0.1, on_complete)
+        future = pywac.record_with_callback(0.1, on_complete)
         
         # Wait for callback
         callback_called.wait(timeout=1.0)
@@ -125,21 +134,37 @@ class TestBasicUsageExample(unittest.TestCase):
         self.assertIsNotNone(received_audio)
         self.assertIsInstance(received_audio, AudioData)
         self.assertGreaterEqual(received_audio.duration, 0.09)
+        
+        # The returned future resolves to the same recording
+        self.assertIs(future.result(timeout=1.0), received_audio)
 
 
 class TestAudioRecorderClass(unittest.TestCase):
     """Test AudioRecorder class functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        # One recorder (and loopback client) shared by every test
+        cls.recorder = pywac.AudioRecorder()
+    
+    def setUp(self):
+        self.recorder._reset()
+    
+    def tearDown(self):
+        # A failed assertion must not leave the shared recorder running
+        if self.recorder.is_recording:
+            self.recorder.stop()
+    
     def test_recorder_initialization(self):
         """Test AudioRecorder initialization"""
-        recorder = pywac.AudioRecorder()
+        recorder = self.recorder
         self.assertEqual(recorder.sample_rate, 48000)
         self.assertEqual(recorder.channels, 2)
         self.assertFalse(recorder.is_recording)
     
     def test_recorder_start_stop(self):
         """Test starting and stopping recording"""
-        recorder = pywac.AudioRecorder()
+        recorder = self.recorder
         
         # Start recording
         success = recorder.start(duration=0.1)
@@ -157,7 +182,7 @@ class TestAudioRecorderClass(unittest.TestCase):
     
     def test_recorder_blocking_record(self):
         """Test blocking record method"""
-        recorder = pywac.AudioRecorder()
+        recorder = self.recorder
         
         # Record for specific duration
         audio = recorder.record(0.1)
@@ -168,7 +193,7 @@ class TestAudioRecorderClass(unittest.TestCase):
     
     def test_recorder_properties(self):
         """Test recorder properties during recording"""
-        recorder = pywac.AudioRecorder()
+        recorder = self.recorder
         
         # Start recording
         recorder.start(duration=0.2)
@@ -187,6 +212,11 @@ class TestAudioRecorderClass(unittest.TestCase):
 class TestSessionManager(unittest.TestCase):
     """Test SessionManager class functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the read-only tests; tests that patch internals make their own
+        cls.manager = pywac.SessionManager()
+    
     def test_session_manager_initialization(self):
         """Test SessionManager initialization"""
         manager = pywac.SessionManager()
@@ -194,7 +224,7 @@ class TestSessionManager(unittest.TestCase):
     
     def test_list_sessions(self):
         """Test listing sessions"""
-        manager = pywac.SessionManager()
+        manager = self.manager
         sessions = manager.list_sessions()
         
         self.assertIsInstance(sessions, list)
@@ -205,9 +235,24 @@ class TestSessionManager(unittest.TestCase):
             self.assertIsInstance(session.process_name, str)
             self.assertIsInstance(session.process_id, int)
     
+    def test_list_sessions_cached(self):
+        """Test that repeated listing reuses the cached enumeration"""
+        manager = pywac.SessionManager(cache_ttl=60.0)
+        manager._enumerator = MagicMock(wraps=manager._enumerator)
+        
+        first = manager.list_sessions()
+        second = manager.list_sessions()
+        self.assertEqual(first, second)
+        self.assertEqual(manager._enumerator.enumerate_sessions.call_count, 1)
+        
+        # Invalidation forces a fresh enumeration
+        manager.invalidate_cache()
+        manager.list_sessions()
+        self.assertEqual(manager._enumerator.enumerate_sessions.call_count, 2)
+    
     def test_get_active_sessions(self):
         """Test getting active sessions"""
-        manager = pywac.SessionManager()
+        manager = self.manager
         active = manager.get_active_sessions()
         
         self.assertIsInstance(active, list)
@@ -216,7 +261,7 @@ class TestSessionManager(unittest.TestCase):
     
     def test_find_session(self):
         """Test finding specific session"""
-        manager = pywac.SessionManager()
+        manager = self.manager
         
         # Try to find System session
         session = manager.find_session("System")
@@ -224,6 +269,20 @@ class TestSessionManager(unittest.TestCase):
         if session:
             self.assertIsInstance(session, pywac.AudioSession)
             self.assertIn("system", session.process_name.lower())
+    
+    def test_find_session_exact_match(self):
+        """Test that an exact name wins over earlier partial matches"""
+        manager = pywac.SessionManager(cache_ttl=60.0)
+        manager._cache = [
+            pywac.AudioSession(1, "SystemSettings.exe", "", 0, 1.0, False),
+            pywac.AudioSession(2, "System", "", 1, 1.0, False),
+        ]
+        manager._cache_time = time.monotonic()
+        manager._cache_change_count = manager._get_change_count()
+        
+        self.assertEqual(manager.find_session("system").process_id, 2)
+        self.assertEqual(manager.find_session("settings").process_id, 1)
+        self.assertIsNone(manager.find_session("no-such-app"))
 
 
 class TestAudioDataIntegration(unittest.TestCase):
@@ -234,25 +293,16 @@ class TestAudioDataIntegration(unittest.TestCase):
         # Record audio
         audio = pywac.record_audio(0.1)
         
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            temp_path = f.name
+        # Round-trip through memory; no file on disk is needed
+        buffer = io.BytesIO()
+        audio.save(buffer)
+        buffer.seek(0)
+        loaded = AudioData.load(buffer)
         
-        try:
-            # Save
-            audio.save(temp_path)
-            self.assertTrue(os.path.exists(temp_path))
-            
-            # Load
-            loaded = AudioData.load(temp_path)
-            
-            # Compare properties
-            self.assertEqual(loaded.sample_rate, audio.sample_rate)
-            self.assertEqual(loaded.channels, audio.channels)
-            self.assertAlmostEqual(loaded.duration, audio.duration, places=2)
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Compare properties
+        self.assertEqual(loaded.sample_rate, audio.sample_rate)
+        self.assertEqual(loaded.channels, audio.channels)
+        self.assertAlmostEqual(loaded.duration, audio.duration, places=2)
     
     def test_audiodata_conversions(self):
         """Test AudioData format conversions"""
@@ -316,22 +366,15 @@ class TestProcessRecording(unittest.TestCase):
     def test_record_process_by_id(self):
         """Test recording from specific process by ID"""
         # Get system PID (0)
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            temp_path = f.name
-        
-        try:
+        with temp_wav_path() as temp_path:
             # Record system audio
             success = pywac.record_process_id(0, temp_path, 0.1)
             
             if success:
-                self.assertTrue(os.path.exists(temp_path))
+                self.assertTrue(temp_path.exists())
                 # Verify it's a valid WAV
                 audio = AudioData.load(temp_path)
                 self.assertGreaterEqual(audio.duration, 0.09)
-                
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
 
 
 class TestUtilsDeprecation(unittest.TestCase):
@@ -342,22 +385,15 @@ class TestUtilsDeprecation(unittest.TestCase):
         # Create test data
         test_data = np.random.randn(4800).astype(np.float32) * 0.1
         
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            # Old way should still work
-            pywac.utils.save_to_wav(test_data, temp_path, 48000, 1)
-            self.assertTrue(os.path.exists(temp_path))
+        with temp_wav_path() as temp_path:
+            # Old way should still work (wave.open() needs a str path)
+            pywac.utils.save_to_wav(test_data, str(temp_path), 48000, 1)
+            self.assertTrue(temp_path.exists())
             
             # Verify file is valid
             audio = AudioData.load(temp_path)
             self.assertEqual(audio.sample_rate, 48000)
             self.assertEqual(audio.channels, 1)
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
     
     def test_convert_float32_to_int16(self):
         """Test float32 to int16 conversion utility"""
@@ -372,25 +408,27 @@ class TestUtilsDeprecation(unittest.TestCase):
         self.assertEqual(int_data[4], -32767)
 
 
+EXAMPLE_TEST_CLASSES = [
+    TestBasicUsageExample,
+    TestAudioRecorderClass,
+    TestSessionManager,
+    TestAudioDataIntegration,
+    TestProcessRecording,
+    TestUtilsDeprecation,
+]
+
+
 def run_example_tests():
     """Run all example tests and return results"""
-    # Create test suite
+    # One runner, run serially: TextTestRunner.run() enters
+    # warnings.catch_warnings(), which is not thread-safe
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
+    for test_class in EXAMPLE_TEST_CLASSES:
+        suite.addTests(loader.loadTestsFromTestCase(test_class))
     
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestBasicUsageExample))
-    suite.addTests(loader.loadTestsFromTestCase(TestAudioRecorderClass))
-    suite.addTests(loader.loadTestsFromTestCase(TestSessionManager))
-    suite.addTests(loader.loadTestsFromTestCase(TestAudioDataIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestProcessRecording))
-    suite.addTests(loader.loadTestsFromTestCase(TestUtilsDeprecation))
-    
-    # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result
+    return runner.run(suite)
 
 
 if __name__ == '__main__':
@@ -8,6 +8,8 @@ These tests verify that the new module structure works correctly:
 
 import pytest
 import threading
+import warnings
+from contextlib import contextmanager
 
 
 # Check if native extensions are available
@@ -25,6 +27,14 @@ requires_native = pytest.mark.skipif(
 )
 
 
+@contextmanager
+def _record_deprecations():
+    """Record warnings, forcing only DeprecationWarning to always be shown."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", DeprecationWarning)
+        yield caught
+
+
 @requires_native
 def test_import_pywac():
     """Test that pywac can be imported cleanly."""
@@ -71,11 +81,9 @@ def test_low_level_api_usage():
 @requires_native
 def test_deprecated_function_warning():
     """Test that deprecated functions emit warnings."""
-    import warnings
     import pywac
 
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+    with _record_deprecations() as w:
         pywac.find_app("nonexistent_test_app")
         assert len(w) == 1
         assert issubclass(w[0].category, DeprecationWarning)
@@ -85,11 +93,9 @@ def test_deprecated_function_warning():
 @requires_native
 def test_deprecated_get_active_apps_warning():
     """Test that get_active_apps() emits deprecation warning."""
-    import warnings
     import pywac
 
-    with warnings.catch_warnings(record=True) as w:
-        warnings.simplefilter("always")
+    with _record_deprecations() as w:
         pywac.get_active_apps()
         assert len(w) == 1
         assert issubclass(w[0].category, DeprecationWarning)
@@ -4,10 +4,57 @@
 import sys
 import os
 import time
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 sys.path.insert(0, os.path.dirname(__file__))
 
 import pywac
 from pywac.unified_recording import record, UnifiedRecorder, capture_system_audio, capture_app_audio
+from _tempdir import tmp_path
+
+# Active session list shared across tests (enumeration is a COM round-trip)
+_SESSION_CACHE = {'ts': 0.0, 'val': None}
+_SESSION_LOCK = threading.Lock()
+
+
+def _sessions(ttl=2.0):
+    """Return active audio sessions, re-enumerating at most every `ttl` seconds."""
+    with _SESSION_LOCK:
+        now = time.monotonic()
+        cache = _SESSION_CACHE
+        if cache['val'] is None or now - cache['ts'] > ttl:
+            cache['val'] = pywac.list_audio_sessions(active_only=True)
+            cache['ts'] = now
+        return cache['val']
+
+
+class _ThreadBufferedStdout:
+    """
+    stdout proxy that routes each worker thread's prints to its own buffer.
+    
+    Only threads that called capture() are buffered. Prints from other
+    threads (e.g. the [CALLBACK]/[ASYNC] output of pywac's recording
+    threads) and native std::cout output bypass sys.stdout, so they still
+    go straight to the console and can interleave with the suite reports.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        """Start buffering output of the calling thread and return the buffer."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
 
 def test_unified_api():
     """Test the new unified recording API"""
@@ -30,7 +77,7 @@ def test_unified_api():
     print("\n2. Testing process recording by name...")
     try:
         # Find active process
-        sessions = pywac.list_audio_sessions(active_only=True)
+        sessions = _sessions()
         if sessions:
             process_name = sessions[0]['process_name']
             print(f"   Target: {process_name}")
@@ -48,7 +95,7 @@ def test_unified_api():
     # Test 3: File output
     print("\n3. Testing direct file output...")
     try:
-        test_file = "test_unified_output.wav"
+        test_file = tmp_path("test_unified_output.wav")
         success = record(duration=1.0, target=None, output_file=test_file)
         if success:
             if os.path.exists(test_file):
@@ -65,23 +112,25 @@ def test_unified_api():
     # Test 4: Async recording with callback
     print("\n4. Testing async recording with callback...")
     callback_results = []
+    callback_done = threading.Event()
     
     def on_recording_complete(audio_data):
         callback_results.append(audio_data)
         print(f"   [CALLBACK] Received {audio_data.duration:.1f}s of audio")
+        callback_done.set()
     
     try:
         result = record(duration=1.0, target=None, on_complete=on_recording_complete)
-        if result is None:
+        if isinstance(result, Future):
             print("   [OK] Async recording started")
-            # Wait for callback
-            time.sleep(1.5)
+            # Wait for callback (returns as soon as it fires)
+            callback_done.wait(timeout=2.0)
             if callback_results:
                 print("   [OK] Callback executed successfully")
             else:
                 print("   [WARNING] Callback not executed")
         else:
-            print("   [ERROR] Should return None for async")
+            print("   [ERROR] Should return a Future for async")
     except Exception as e:
         print(f"   [ERROR] {e}")
 
@@ -109,17 +158,18 @@ def test_recorder_class():
     
     # Test 2: Process recorder by name
     print("\n2. Testing process UnifiedRecorder...")
-    sessions = pywac.list_audio_sessions(active_only=True)
+    sessions = _sessions()
     if sessions:
         process_name = sessions[0]['process_name']
         try:
             recorder = UnifiedRecorder(target=process_name)
             if recorder.is_available():
-                success = recorder.record_to_file(0.5, "test_recorder.wav")
-                if success and os.path.exists("test_recorder.wav"):
-                    size = os.path.getsize("test_recorder.wav") / 1024
+                test_file = tmp_path("test_recorder.wav")
+                success = recorder.record_to_file(0.5, test_file)
+                if success and os.path.exists(test_file):
+                    size = os.path.getsize(test_file) / 1024
                     print(f"   [OK] Process recorder: saved {size:.1f} KB")
-                    os.remove("test_recorder.wav")
+                    os.remove(test_file)
                 else:
                     print("   [ERROR] Recording failed")
             else:
@@ -132,16 +182,18 @@ def test_recorder_class():
     # Test 3: Async recording
     print("\n3. Testing async UnifiedRecorder...")
     async_results = []
+    async_done = threading.Event()
     
     def handle_async(audio):
         async_results.append(audio)
         print(f"   [ASYNC] Got {audio.duration:.1f}s")
+        async_done.set()
     
     try:
         recorder = UnifiedRecorder()
         recorder.record_async(0.5, handle_async)
         print("   [OK] Async started")
-        time.sleep(1.0)
+        async_done.wait(timeout=1.5)
         if async_results:
             print("   [OK] Async completed")
         else:
@@ -168,7 +220,7 @@ def test_convenience_functions():
         print(f"   [ERROR] {e}")
     
     # Test 2: capture_app_audio
-    sessions = pywac.list_audio_sessions(active_only=True)
+    sessions = _sessions()
     if sessions:
         app_name = sessions[0]['process_name'].replace('.exe', '')
         print(f"\n2. Testing capture_app_audio ('{app_name}')...")
@@ -191,9 +243,10 @@ def test_backward_compatibility():
     print("=" * 60)
     
     # Test original APIs
+    compat_file = tmp_path("test_compat.wav")
     tests = [
         ("record_audio", lambda: pywac.record_audio(0.5)),
-        ("record_to_file", lambda: pywac.record_to_file("test_compat.wav", 0.5)),
+        ("record_to_file", lambda: pywac.record_to_file(compat_file, 0.5)),
         ("record_with_callback", lambda: pywac.record_with_callback(0.5, lambda x: None)),
     ]
     
@@ -207,9 +260,9 @@ def test_backward_compatibility():
                 else:
                     print(f"   [WARNING] {name} returned no data")
             elif name == "record_to_file":
-                if os.path.exists("test_compat.wav"):
+                if os.path.exists(compat_file):
                     print(f"   [OK] {name} works")
-                    os.remove("test_compat.wav")
+                    os.remove(compat_file)
                 else:
                     print(f"   [WARNING] {name} file not created")
             else:
@@ -218,17 +271,18 @@ def test_backward_compatibility():
             print(f"   [ERROR] {name}: {e}")
     
     # Test process recording
-    sessions = pywac.list_audio_sessions(active_only=True)
+    sessions = _sessions()
     if sessions:
         process = sessions[0]['process_name']
         pid = sessions[0]['process_id']
         
         print(f"\nrecord_process ('{process}')...")
         try:
-            success = pywac.record_process(process, "test_process.wav", 0.5)
-            if success and os.path.exists("test_process.wav"):
+            process_file = tmp_path("test_process.wav")
+            success = pywac.record_process(process, process_file, 0.5)
+            if success and os.path.exists(process_file):
                 print("   [OK] record_process works")
-                os.remove("test_process.wav")
+                os.remove(process_file)
             else:
                 print("   [WARNING] record_process failed")
         except Exception as e:
@@ -236,10 +290,11 @@ def test_backward_compatibility():
         
         print(f"\nrecord_process_id ({pid})...")
         try:
-            success = pywac.record_process_id(pid, "test_pid.wav", 0.5)
-            if success and os.path.exists("test_pid.wav"):
+            pid_file = tmp_path("test_pid.wav")
+            success = pywac.record_process_id(pid, pid_file, 0.5)
+            if success and os.path.exists(pid_file):
                 print("   [OK] record_process_id works")
-                os.remove("test_pid.wav")
+                os.remove(pid_file)
             else:
                 print("   [WARNING] record_process_id failed")
         except Exception as e:
@@ -253,21 +308,41 @@ def main():
     print("PyWAC Unified Recording Test Suite (v0.4.2)")
     print("=" * 60)
     
-    test_unified_api()
-    test_recorder_class()
-    test_convenience_functions()
-    test_backward_compatibility()
+    suites = [
+        test_unified_api,
+        test_recorder_class,
+        test_convenience_functions,
+        test_backward_compatibility,
+    ]
+    
+    # The suites mostly wait on recordings and callbacks, so run them
+    # concurrently (shared-mode loopback capture allows several clients)
+    # and print each suite's output in order once it has finished
+    # (callback/async thread and native output is not reordered)
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    
+    def run_suite(suite):
+        buffer = stdout.capture()
+        try:
+            suite()
+        except Exception as e:
+            print(f"   [ERROR] {suite.__name__}: {e}")
+        return buffer.getvalue()
+    
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            outputs = list(executor.map(run_suite, suites))
+    finally:
+        sys.stdout = stdout._stream
+    
+    for output in outputs:
+        sys.stdout.write(output)
     
     print("\n" + "=" * 60)
     print("TEST COMPLETE")
     print("=" * 60)
     
-    # Clean up any remaining test files
-    for filename in ["test_unified_output.wav", "test_recorder.wav", 
-                     "test_compat.wav", "test_process.wav", "test_pid.wav"]:
-        if os.path.exists(filename):
-            os.remove(filename)
-    
     return 0
 
 
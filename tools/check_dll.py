@@ -3,6 +3,21 @@ import os
 import sys
 import ctypes
 
+
+def find_pyd_files(*directories):
+    """Return (path, size) for each .pyd file, using scandir's cached stat."""
+    found = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.pyd') and entry.is_file():
+                        found.append((entry.path, entry.stat().st_size))
+        except OSError:
+            continue
+    return found
+
+
 print("Checking pywac module dependencies...")
 print(f"Python version: {sys.version}")
 print(f"Python executable: {sys.executable}")
@@ -18,12 +33,10 @@ print(f"\nModule path: {parent_path}")
 
 # List .pyd files in parent and pywac directories
 print("\n.pyd files found:")
-import glob
-pyd_files = glob.glob(os.path.join(parent_path, '*.pyd'))
-pyd_files.extend(glob.glob(os.path.join(parent_path, 'pywac', '*.pyd')))
+pyd_entries = find_pyd_files(parent_path, os.path.join(parent_path, 'pywac'))
+pyd_files = [path for path, _ in pyd_entries]
 
-for filepath in pyd_files:
-    size = os.path.getsize(filepath)
+for filepath, size in pyd_entries:
     filename = os.path.basename(filepath)
     print(f"  - {filename} ({size:,} bytes)")
 
@@ -5,26 +5,286 @@ Debug script to investigate process name detection issues
 import sys
 import os
 import ctypes
+import functools
+import operator
 from ctypes import wintypes
-import psutil  # Will need: pip install psutil
 
 # Add parent directory to path
 parent_path = os.path.dirname(os.path.dirname(__file__))
 if parent_path not in sys.path:
     sys.path.insert(0, parent_path)
 
+# NtQuerySystemInformation: one call returns a record for every process
+_SYSTEM_PROCESS_INFORMATION_CLASS = 5
+_STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+
+
+class _UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ('Length', wintypes.USHORT),
+        ('MaximumLength', wintypes.USHORT),
+        ('Buffer', ctypes.c_void_p),
+    ]
+
+
+class _SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Leading fields only; records are walked via NextEntryOffset
+    _fields_ = [
+        ('NextEntryOffset', wintypes.ULONG),
+        ('NumberOfThreads', wintypes.ULONG),
+        ('Reserved', ctypes.c_byte * 48),  # WorkingSetPrivateSize .. KernelTime
+        ('ImageName', _UNICODE_STRING),
+        ('BasePriority', wintypes.LONG),
+        ('UniqueProcessId', ctypes.c_void_p),
+    ]
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', wintypes.DWORD),
+        ('cntUsage', wintypes.DWORD),
+        ('th32ProcessID', wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', wintypes.DWORD),
+        ('cntThreads', wintypes.DWORD),
+        ('th32ParentProcessID', wintypes.DWORD),
+        ('pcPriClassBase', wintypes.LONG),
+        ('dwFlags', wintypes.DWORD),
+        ('szExeFile', wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+
+_TH32CS_SNAPPROCESS = 0x2
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_ERROR_INSUFFICIENT_BUFFER = 122
+
+
+def _win32_function(dll, name, argtypes, restype):
+    """Resolve a Win32 export once and declare its prototype"""
+    function = getattr(dll, name)
+    function.argtypes = argtypes
+    function.restype = restype
+    return function
+
+
+# Win32 entry points, resolved once at import (None off Windows)
+if sys.platform == 'win32':
+    _ntdll = ctypes.WinDLL('ntdll')
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _NtQuerySystemInformation = _win32_function(
+        _ntdll, 'NtQuerySystemInformation',
+        [wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)],
+        wintypes.LONG)
+    _CreateToolhelp32Snapshot = _win32_function(
+        _kernel32, 'CreateToolhelp32Snapshot', [wintypes.DWORD, wintypes.DWORD], wintypes.HANDLE)
+    _Process32FirstW = _win32_function(
+        _kernel32, 'Process32FirstW',
+        [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)], wintypes.BOOL)
+    _Process32NextW = _win32_function(
+        _kernel32, 'Process32NextW',
+        [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)], wintypes.BOOL)
+    _OpenProcess = _win32_function(
+        _kernel32, 'OpenProcess', [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD], wintypes.HANDLE)
+    _QueryFullProcessImageNameW = _win32_function(
+        _kernel32, 'QueryFullProcessImageNameW',
+        [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)],
+        wintypes.BOOL)
+    _CloseHandle = _win32_function(_kernel32, 'CloseHandle', [wintypes.HANDLE], wintypes.BOOL)
+else:
+    _ntdll = _kernel32 = None
+
+
+# Pseudo-processes whose names no per-PID query can return
+_KNOWN_PIDS = {0: 'System Idle Process', 4: 'System'}
+
+# PID -> image name, filled by _refresh_process_cache() (None until first needed)
+_process_names = None
+
+
+def _snapshot_process_names():
+    """Map every PID to its image name with a single NtQuerySystemInformation call"""
+    if _ntdll is None:
+        raise OSError("NtQuerySystemInformation requires Windows")
+    
+    # Grow the buffer until the whole process list fits
+    size = 0x40000
+    while True:
+        buffer = ctypes.create_string_buffer(size)
+        needed = wintypes.ULONG(0)
+        status = _NtQuerySystemInformation(_SYSTEM_PROCESS_INFORMATION_CLASS, buffer, size,
+                                           ctypes.byref(needed)) & 0xFFFFFFFF
+        if status != _STATUS_INFO_LENGTH_MISMATCH:
+            break
+        size = max(size * 2, needed.value + 0x10000)
+    if status != 0:
+        raise OSError(f"NtQuerySystemInformation failed: 0x{status:08X}")
+    
+    names = {}
+    base = ctypes.addressof(buffer)
+    offset = 0
+    while True:
+        info = _SYSTEM_PROCESS_INFORMATION.from_address(base + offset)
+        image = info.ImageName
+        name = ctypes.wstring_at(image.Buffer, image.Length // 2) if image.Buffer else ''
+        names[info.UniqueProcessId or 0] = os.path.basename(name)
+        if not info.NextEntryOffset:
+            break
+        offset += info.NextEntryOffset
+    return names
+
+
+def _toolhelp_process_names():
+    """Map every PID to its image name from one Toolhelp32 process snapshot"""
+    if _kernel32 is None:
+        raise OSError("Toolhelp32 snapshots require Windows")
+    
+    snapshot = _CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    names = {}
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        more = _Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            names[entry.th32ProcessID] = entry.szExeFile
+            more = _Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _CloseHandle(snapshot)
+    return names
+
+
+def _query_image_name(pid):
+    """Resolve a PID to its image name via QueryFullProcessImageNameW; None on failure"""
+    if _kernel32 is None:
+        return None
+    
+    handle = _OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        # Paths can exceed MAX_PATH; retry with a larger buffer when told to
+        capacity = wintypes.MAX_PATH
+        while capacity <= 0x8000:
+            buffer = ctypes.create_unicode_buffer(capacity)
+            size = wintypes.DWORD(capacity)
+            if _QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                return os.path.basename(buffer.value[:size.value])
+            if ctypes.get_last_error() != _ERROR_INSUFFICIENT_BUFFER:
+                return None
+            capacity *= 2
+        return None
+    finally:
+        _CloseHandle(handle)
+
+
+def _refresh_process_cache():
+    """Refresh the PID -> name cache; returns False if no snapshot was available"""
+    global _process_names
+    for snapshot in (_snapshot_process_names, _toolhelp_process_names):
+        try:
+            _process_names = snapshot()
+            return True
+        except (OSError, AttributeError) as e:
+            print(f"[WARN] {snapshot.__name__} unavailable: {e}")
+    _process_names = {}
+    return False
+
+
+# psutil module once imported by _load_psutil(); False if it is not installed
+_psutil = None
+
+
+def _load_psutil():
+    """Import psutil on first use (pip install psutil); returns None if unavailable"""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+            _psutil = psutil
+        except ImportError:
+            _psutil = False
+    return _psutil or None
+
+
+def _snapshot_name(pid):
+    """Look a PID up in the process snapshot, taking it on first use"""
+    if _process_names is None:
+        _refresh_process_cache()
+    return _process_names.get(pid)
+
+
+@functools.lru_cache(maxsize=512)
+def _psutil_process_info(pid):
+    """Fetch (name, exe, cmdline, status) for a PID in one batched psutil query"""
+    process = _psutil.Process(pid)
+    with process.oneshot():
+        return process.name(), process.exe(), tuple(process.cmdline()), process.status()
+
+
 def get_process_info_with_psutil(pid):
     """Get process information using psutil for comparison"""
+    psutil = _load_psutil()
+    if psutil is None:
+        return {'error': "psutil not installed - install with: pip install psutil"}
     try:
-        process = psutil.Process(pid)
-        return {
-            'name': process.name(),
-            'exe': process.exe(),
-            'cmdline': process.cmdline(),
-            'status': process.status()
-        }
+        name, exe, cmdline, status = _psutil_process_info(pid)
     except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
         return {'error': str(e)}
+    return {
+        'name': name,
+        'exe': exe,
+        'cmdline': list(cmdline),
+        'status': status
+    }
+
+# AudioSessionState values 0..2
+_STATE_NAMES = ('Inactive', 'Active', 'Expired')
+
+def _get_sessions(pywac):
+    """Enumerate audio sessions with whichever API pywac provides"""
+    if hasattr(pywac, 'SessionEnumerator'):
+        return pywac.SessionEnumerator().enumerate_sessions()
+    if hasattr(pywac, 'list_audio_sessions'):
+        return pywac.list_audio_sessions()
+    raise AttributeError("pywac module doesn't have expected methods")
+
+
+def _field_getter(sample, names, default):
+    """Return a getter for the first of `names` the session format provides
+
+    An itemgetter/attrgetter for dicts/objects, or a constant-default
+    function when the format has none of the names.
+    """
+    if isinstance(sample, dict):
+        for field in names:
+            if field in sample:
+                return operator.itemgetter(field)
+    else:
+        for field in names:
+            if hasattr(sample, field):
+                return operator.attrgetter(field)
+    return lambda session: default
+
+
+def _session_accessor(sample):
+    """Pick a (pid, name, display_name, state) reader once for the session format"""
+    if isinstance(sample, dict):
+        pid = _field_getter(sample, ('pid', 'process_id'), 0)
+        name = _field_getter(sample, ('name', 'process_name'), 'Unknown')
+    else:
+        pid = _field_getter(sample, ('process_id', 'pid'), 0)
+        name = _field_getter(sample, ('process_name', 'name'), 'Unknown')
+    display_name = _field_getter(sample, ('display_name',), '(empty)')
+    state = _field_getter(sample, ('state',), -1)
+    
+    def fields(session):
+        return pid(session), name(session), display_name(session), state(session)
+    return fields
+
 
 def main():
     try:
@@ -39,76 +299,68 @@ def main():
     
     # Try to get sessions from pywac
     try:
-        if hasattr(pywac, 'SessionEnumerator'):
-            enumerator = pywac.SessionEnumerator()
-            sessions = enumerator.enumerate_sessions()
-        elif hasattr(pywac, 'list_audio_sessions'):
-            sessions = pywac.list_audio_sessions()
-        else:
-            print("[ERROR] pywac module doesn't have expected methods")
-            print(f"Available attributes: {dir(pywac)}")
-            return
+        sessions = _get_sessions(pywac)
+    except AttributeError as e:
+        print(f"[ERROR] {e}")
+        print(f"Available attributes: {dir(pywac)}")
+        return
     except Exception as e:
         print(f"[ERROR] Failed to enumerate sessions: {e}")
         return
     
     print(f"\n[INFO] Found {len(sessions)} audio sessions\n")
     
-    # Check if psutil is available
-    has_psutil = False
-    try:
-        import psutil
-        has_psutil = True
-        print("[OK] psutil available for cross-checking\n")
-    except ImportError:
-        print("[WARN] psutil not installed - install with: pip install psutil\n")
+    # Handle both dict and object formats (a list is never mixed)
+    session_fields = _session_accessor(sessions[0] if sessions else None)
     
-    # Analyze each session
+    # Analyze each session, counting Unknown names as we go
+    unknown_count = 0
     for i, session in enumerate(sessions, 1):
-        # Handle both dict and object formats
-        if isinstance(session, dict):
-            pid = session.get('pid', session.get('process_id', 0))
-            name = session.get('name', session.get('process_name', 'Unknown'))
-            display_name = session.get('display_name', '(empty)')
-            state = session.get('state', -1)
-        else:
-            pid = getattr(session, 'process_id', getattr(session, 'pid', 0))
-            name = getattr(session, 'process_name', getattr(session, 'name', 'Unknown'))
-            display_name = getattr(session, 'display_name', '(empty)')
-            state = getattr(session, 'state', -1)
+        pid, name, display_name, state = session_fields(session)
         
         print(f"Session {i}:")
         print(f"  PID: {pid}")
         print(f"  PyWAC Name: {name}")
         print(f"  Display Name: {display_name if display_name else '(empty)'}")
-        try:
-            state_int = int(state) if state != -1 else -1
-            if state_int >= 0 and state_int <= 2:
-                print(f"  State: {['Inactive', 'Active', 'Expired'][state_int]}")
-        except (ValueError, TypeError):
-            pass  # Skip state if it's not a valid number
+        state = getattr(state, 'value', state)  # SessionState enum -> int
+        if isinstance(state, int) and 0 <= state <= 2:
+            print(f"  State: {_STATE_NAMES[state]}")
+        elif state in _STATE_NAMES:  # list_audio_sessions() already decodes it
+            print(f"  State: {state}")
         
         # If pywac returns "Unknown", try to get more info
-        if name == "Unknown" and has_psutil:
-            psutil_info = get_process_info_with_psutil(pid)
-            if 'error' not in psutil_info:
-                print(f"  Actual Name (psutil): {psutil_info['name']}")
-                print(f"  Executable: {psutil_info['exe']}")
+        if name == "Unknown":
+            unknown_count += 1
+            
+            # Idle/System never resolve through a process handle or psutil
+            if pid in _KNOWN_PIDS:
+                print(f"  Actual Name (known PID): {_KNOWN_PIDS[pid]}")
+            elif (image_name := _snapshot_name(pid)):
+                print(f"  Actual Name (snapshot): {image_name}")
+            # Not in the snapshot: ask for this PID's image name directly,
+            # falling back to psutil (imported here, on first need) if that fails
+            elif (image_name := _query_image_name(pid)):
+                print(f"  Actual Name (QueryFullProcessImageNameW): {image_name}")
             else:
-                print(f"  psutil Error: {psutil_info['error']}")
+                psutil_info = get_process_info_with_psutil(pid)
+                if 'error' not in psutil_info:
+                    print(f"  Actual Name (psutil): {psutil_info['name']}")
+                    print(f"  Executable: {psutil_info['exe']}")
+                else:
+                    print(f"  psutil Error: {psutil_info['error']}")
         
         print()
     
     # Analysis summary
-    unknown_count = sum(1 for s in sessions if (s.get('name', s.get('process_name', 'Unknown')) if isinstance(s, dict) else getattr(s, 'process_name', getattr(s, 'name', 'Unknown'))) == "Unknown")
     if unknown_count > 0:
         print(f"\n[ANALYSIS] {unknown_count} of {len(sessions)} sessions have 'Unknown' process names")
         print("\nPossible causes:")
         print("1. Insufficient permissions to access process information")
         print("2. Process is running with higher privileges")
         print("3. Process is a protected/system process")
-        print("4. GetModuleBaseNameA API limitation")
-        print("\nSuggested fix: Use QueryFullProcessImageNameA instead of GetModuleBaseNameA")
+        print("\nNote: pywac already resolves names with QueryFullProcessImageName;")
+        print("the 'Actual Name' lines above show what the snapshot or this")
+        print("tool's own lookup could still recover (try running as Administrator)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
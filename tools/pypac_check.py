@@ -6,6 +6,27 @@ import sys
 import os
 import platform
 import ctypes
+import importlib.util
+from importlib.machinery import EXTENSION_SUFFIXES
+
+# Win32 functions resolved once at import; None off Windows
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+if sys.platform == 'win32':
+    _GetFileAttributesW = ctypes.WinDLL('kernel32', use_last_error=True).GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+    _IsUserAnAdmin = ctypes.WinDLL('shell32', use_last_error=True).IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = ()
+    _IsUserAnAdmin.restype = ctypes.c_int
+else:
+    _GetFileAttributesW = None
+    _IsUserAnAdmin = None
+
+def file_exists(path):
+    """Return True if `path` exists (one GetFileAttributesW call on Windows)"""
+    if _GetFileAttributesW is None:
+        return os.path.exists(path)
+    return _GetFileAttributesW(path) != INVALID_FILE_ATTRIBUTES
 
 def check_environment():
     """Check system environment"""
@@ -34,31 +55,46 @@ def check_environment():
     
     # Check admin privileges
     try:
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin()
+        is_admin = _IsUserAnAdmin()
         print(f"Administrator Privileges: {'Yes' if is_admin else 'No'}")
     except:
         print("Administrator Privileges: Unknown")
     
     return True
 
+def _report_dependency(module, purpose, found):
+    """Print the status line for one dependency"""
+    if found:
+        print(f"[OK] {module} - {purpose}")
+    else:
+        print(f"[MISSING] {module} - {purpose}")
+        print(f"  Install with: pip install {module}")
+
 def check_dependencies():
     """Check required dependencies"""
     print("\n" + "=" * 60)
     print("DEPENDENCY CHECK")
     print("=" * 60)
     
-    dependencies = {
-        'pybind11': 'Build requirement',
+    # Runtime dependencies are imported; build-only ones are just located,
+    # since importing them is not needed to use an already built pywac
+    runtime_dependencies = {
         'numpy': 'Audio processing',
     }
+    build_dependencies = {
+        'pybind11': 'Build requirement',
+    }
     
-    for module, purpose in dependencies.items():
+    for module, purpose in runtime_dependencies.items():
         try:
             __import__(module)
-            print(f"[OK] {module} - {purpose}")
+            found = True
         except ImportError:
-            print(f"[MISSING] {module} - {purpose}")
-            print(f"  Install with: pip install {module}")
+            found = False
+        _report_dependency(module, purpose, found)
+    
+    for module, purpose in build_dependencies.items():
+        _report_dependency(module, purpose, importlib.util.find_spec(module) is not None)
 
 def check_module_files():
     """Check if module files exist"""
@@ -81,36 +117,45 @@ def check_module_files():
     # Optional modules (not required but checked if present)
     optional_modules = {}
     
-    # Look for .pyd files
-    import glob
-    pyd_files = glob.glob(os.path.join(parent_path, '*.pyd'))
-    # Also check pywac subdirectory
-    pyd_files.extend(glob.glob(os.path.join(parent_path, 'pywac', '*.pyd')))
+    # One directory read per search dir; DirEntry.stat() reuses the data
+    # from the listing, so sizes need no separate getsize() call
+    search_dirs = [parent_path, os.path.join(parent_path, 'pywac')]
+    suffixes = tuple(EXTENSION_SUFFIXES)
+    extension_files = {}
+    for directory in search_dirs:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(suffixes) and entry.name not in extension_files:
+                        extension_files[entry.name] = entry.stat().st_size
+        except OSError:
+            continue
+    
+    def find_module_file(module_name):
+        """Return (file name, size) of a built extension such as core.cp311-win_amd64.pyd"""
+        for suffix in EXTENSION_SUFFIXES:
+            name = module_name + suffix
+            if name in extension_files:
+                return name, extension_files[name]
+        return None
     
     # Check required modules
     for module_name, description in expected_modules.items():
-        found = False
-        for pyd in pyd_files:
-            basename = os.path.basename(pyd)
-            if module_name in basename:
-                size = os.path.getsize(pyd)
-                print(f"[OK] {basename} ({size:,} bytes) - {description}")
-                modules_found.append(module_name)
-                found = True
-                break
-        
-        if not found:
+        found = find_module_file(module_name)
+        if found:
+            name, size = found
+            print(f"[OK] {name} ({size:,} bytes) - {description}")
+            modules_found.append(module_name)
+        else:
             print(f"[MISSING] {module_name} - {description}")
             modules_missing.append(module_name)
     
     # Check optional modules (just report if present)
     for module_name, description in optional_modules.items():
-        for pyd in pyd_files:
-            basename = os.path.basename(pyd)
-            if module_name in basename:
-                size = os.path.getsize(pyd)
-                print(f"[INFO] {basename} ({size:,} bytes) - {description}")
-                break
+        found = find_module_file(module_name)
+        if found:
+            name, size = found
+            print(f"[INFO] {name} ({size:,} bytes) - {description}")
     
     if modules_missing:
         print("\nTo build missing modules:")
@@ -136,8 +181,7 @@ def check_vcredist():
     
     all_found = True
     for dll in dlls:
-        dll_path = os.path.join(system32, dll)
-        if os.path.exists(dll_path):
+        if file_exists(os.path.join(system32, dll)):
             print(f"[OK] {dll}")
         else:
             print(f"[MISSING] {dll}")